@@ -10,24 +10,33 @@ import uos as os
 import sys
 from micropython_ra8875.py.colors import *  # Colors
 from micropython_ra8875.driver.tft_local import setup
+from micropython_ra8875.driver.ra8875 import TOUCH_UP
 
 tft = setup(True, True)
 
-ll = 20  # Crosshairs for calibration
-lc = YELLOW
-tft.draw_hline(0, 0, ll, lc)
-tft.draw_vline(0, 0, ll, lc)
-tft.draw_hline(tft.width() -ll - 1, tft.height() - 1, ll, lc)
-tft.draw_vline(tft.width() - 1, tft.height() -ll - 1, ll, lc)
+# Three calibration targets: an affine transform corrects scale, offset,
+# rotation and skew.
+ch = 10  # Crosshair half length
+w = tft.width()
+h = tft.height()
+targets = ((w // 10, h // 10), (w - w // 10, h // 2), (w // 2, h - h // 10))
 
-msg1 = '''To calibrate touch the screen at the top left
-and bottom right hand corners of the screen
-where the yellow lines meet - ideally with a
-stylus.
-When you have done this, press ctrl-c.
-You will have the option to update tft_local.py.
+def crosshair(n, color):
+    x, y = targets[n]
+    tft.draw_hline(x - ch, y, 2 * ch, color)
+    tft.draw_vline(x, y - ch, 2 * ch, color)
 
-Press ctrl-c to continue.'''
+for n in range(len(targets)):
+    crosshair(n, GREY)
+crosshair(0, YELLOW)
+
+msg1 = '''To calibrate touch the centre of each cross in
+turn, ideally with a stylus. The current target
+is yellow.
+When you have done this you will have the
+option to update tft_local.py.
+
+Press ctrl-c to quit.'''
 
 x = 50
 y = 80
@@ -35,15 +44,29 @@ for s in msg1.split('\n'):
     tft.draw_str(s, x, y, GREEN, BLACK)
     y += 16
 
-data = [0, 0, 0, 0]
+points = []  # Raw touch coordinates of each target
 async def do_touch(tft):
-    while True:
-        if tft.ready():
-            x, y = tft.get_touch()
-            offs = 0 if x < 100 else 2
-            data[offs : offs + 2] = x, y
-            print(x, y)
-        await asyncio.sleep_ms(20)
+    while len(points) < len(targets):
+        await tft.touch_event()
+        ev = tft.get_event()
+        if ev is not None and ev[0] == TOUCH_UP:  # Last position of a touch
+            n = len(points)
+            points.append(ev[1:3])
+            print(*ev[1:3])
+            crosshair(n, GREEN)
+            if n + 1 < len(targets):
+                crosshair(n + 1, YELLOW)
+
+# Solve for p, q, r such that s = p * x + q * y + r where x, y are raw
+# coordinates and s is the corresponding screen coordinate. Return integer
+# coefficients scaled by 2**16, r including a rounding term.
+def solve(s1, s2, s3):
+    (x1, y1), (x2, y2), (x3, y3) = points
+    det = x1 * (y2 - y3) + x2 * (y3 - y1) + x3 * (y1 - y2)
+    p = (s1 * (y2 - y3) + s2 * (y3 - y1) + s3 * (y1 - y2)) / det
+    q = (s1 * (x3 - x2) + s2 * (x1 - x3) + s3 * (x2 - x1)) / det
+    r = (s1 * (x2 * y3 - x3 * y2) + s2 * (x3 * y1 - x1 * y3) + s3 * (x1 * y2 - x2 * y1)) / det
+    return round(p * 65536), round(q * 65536), round(r * 65536) + 32768
 
 print('See on-screen instructions.')
 try:
@@ -53,7 +76,17 @@ except KeyboardInterrupt:
 finally:
     asyncio.new_event_loop()
 
-if not data[2] or not input('Keep these calibration values (y/n)? ').lower() == 'y':
+if len(points) < len(targets):
+    print('Calibration incomplete. Quitting.')
+    sys.exit(0)
+try:
+    data = solve(*(t[0] for t in targets)) + solve(*(t[1] for t in targets))
+except ZeroDivisionError:
+    print('Touch points were in line. Please try again.')
+    sys.exit(1)
+print('Coefficients', data)
+
+if not input('Keep these calibration values (y/n)? ').lower() == 'y':
     print('No changes made. Quitting.')
     sys.exit(0)
 
@@ -63,7 +96,7 @@ try:
     with open(source, 'r') as fr, open(temp, 'w') as fw:
         for line in fr:
             if 'tft.calibrate' in line:
-                line = '    tft.calibrate({:d},{:d},{:d},{:d})  # Auto updated by cal.py\n'.format(*data)
+                line = '    tft.calibrate_affine({:d},{:d},{:d},{:d},{:d},{:d})  # Auto updated by cal.py\n'.format(*data)
             fw.write(line)
 except OSError:
     print('Could not open {:s} for reading or {:s} for writing.'.format(source, temp))
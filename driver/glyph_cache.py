@@ -0,0 +1,48 @@
+# glyph_cache.py LRU cache of glyphs expanded to RGB565 for the ra8875 driver.
+
+# Released under the MIT License (MIT). See LICENSE.
+# Copyright (c) 2019-2020 Peter Hinch
+
+# Entries are keyed on (font, char, fgcolor, bgcolor). Values are bytearrays
+# holding the glyph's pixels as RGB565, MSB first. The total size of the values
+# is constrained to a byte budget with the least recently used entries being
+# discarded. The OrderedDict holds entries in order of use: a hit moves the
+# entry to the end, so eviction is from the front.
+
+from ucollections import OrderedDict
+
+class GlyphCache:
+    def __init__(self, nbytes):
+        self.nbytes = nbytes  # Budget
+        self.used = 0  # Bytes in use
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def get(self, key):
+        entries = self._entries
+        buf = entries.pop(key, None)
+        if buf is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        entries[key] = buf  # Now most recently used
+        return buf
+
+    # Add an entry. Return False if it is larger than the entire budget.
+    def put(self, key, buf):
+        n = len(buf)
+        if n > self.nbytes:
+            return False
+        entries = self._entries
+        while self.used + n > self.nbytes:  # Discard least recently used
+            self.used -= len(entries.pop(next(iter(entries))))
+        entries[key] = buf
+        self.used += n
+        return True
+
+    def clear(self):
+        self._entries = OrderedDict()
+        self.used = 0
+        self.hits = 0
+        self.misses = 0
@@ -20,12 +20,75 @@
 
 # Updated for uasyncio V3
 
-from utime import sleep_ms
+from utime import sleep_ms, ticks_ms, ticks_diff
 import uasyncio as asyncio
 from uctypes import addressof
 from micropython import const
+from array import array
+import math
 
 MAX_CHAR_WIDTH = const(100)
+MAX_STR_WIDTH = const(800)  # Max pixel width of a string segment in .draw_text
+MAX_STR_CHARS = const(64)  # Max no. of glyphs in a string segment
+_NREGS = const(32)  # Max no. of register writes in a batch
+_ARC_SEG = const(6)  # Approximate segment length of a software arc (pixels)
+_HALFPI = math.pi / 2
+
+# Registers whose contents only change when written by the host. These are
+# shadowed so that writes of unchanged values can be skipped. Cursor registers
+# (which auto-increment), command and status registers must not be included.
+# Each entry is a (first, last) range of register numbers.
+_SHADOWED = bytearray(256)
+for _first, _last in ((0x21, 0x22), (0x30, 0x37), (0x40, 0x40), (0x51, 0x51),
+                      (0x54, 0x5f), (0x60, 0x65), (0x91, 0x9d), (0xa1, 0xac)):
+    for _r in range(_first, _last + 1):
+        _SHADOWED[_r] = 1
+
+# Status (reg, mask) which indicates that a graphics operation is in progress
+_DCR_BUSY = (0x90, 0x80)  # Line, rectangle, triangle
+_CIRC_BUSY = (0x90, 0x40)  # Circle
+_ELL_BUSY = (0xa0, 0x80)  # Ellipse, curve, clipped rectangle
+_CLR_BUSY = (0x8e, 0x80)  # Memory clear
+_BTE_BUSY = (0x50, 0x80)  # Block transfer engine
+
+# Graphics engine operations which may be deferred. Each is an index into
+# RA8875._ops, the corresponding entry of _CPOS being the position of the
+# color arg (-1 if none).
+_OP_RECT = const(0)
+_OP_DCR = const(1)
+_OP_CIRC = const(2)
+_OP_LINE = const(3)
+_OP_TRI = const(4)
+_OP_ELL = const(5)
+_OP_BFILL = const(6)
+_OP_BCOPY = const(7)
+_OP_CLR = const(8)
+_CPOS = (4, 4, 3, 4, 6, 4, 4, -1, -1)
+# A deferred command record holds op, no. of args, args (color packed as int)
+_RECLEN = const(11)
+_SLICE_MS = const(10)  # Max time the drain task runs before yielding
+# Touch sampling
+_TPOLL_MS = const(30)  # Polling period if no interrupt pin
+_TFAST_MS = const(10)  # Period while touched if interrupt driven
+_TRELEASE = const(3)  # No. of samples without touch which signify release
+_TEVENTS = const(16)  # Capacity of touch event ring
+_TMEDIAN = const(7)  # Max length of touch median filter
+
+# Touch event types
+TOUCH_DOWN = const(1)
+TOUCH_MOVE = const(2)
+TOUCH_UP = const(3)
+
+# BTE raster operations for .bte_copy: S is source, D is destination
+ROP_BLACK = const(0x0)
+ROP_NOT_S = const(0x3)
+ROP_NOT_D = const(0x5)
+ROP_XOR = const(0x6)
+ROP_AND = const(0x8)
+ROP_D = const(0xa)
+ROP_S = const(0xc)  # Normal copy
+ROP_OR = const(0xe)
+ROP_WHITE = const(0xf)
 
 # Copy a row of a glyph to a destination buffer. Each bit is output as a 16 bit
 # color value
@@ -57,6 +120,175 @@ def lcopy(ps : ptr8, pd : ptr8, bcbg : int, fgc : int):
             mask = 0x80
             sp += 1
 
+# Expand one pixel row of a sequence of glyphs into a scanline buffer.
+# pd Destination: 3 byte preamble followed by RGB565 pixels
+# pg pg[0] and pg[1] are foreground and background colors as for lcopy. These
+# are followed by an (address, columns, bytes per row) triple for each glyph.
+# If bit 15 of columns is set the glyph has already been expanded to RGB565.
+# n No. of glyphs.
+# row Row to expand.
+@micropython.viper
+def scopy(pd : ptr8, pg : ptr32, n : int, row : int):
+    fgc0 = pg[0] & 0xff
+    fgc1 = (pg[0] & 0xff00) >> 8
+    bgc0 = pg[1] & 0xff
+    bgc1 = (pg[1] & 0xff00) >> 8
+    dp = 3  # Skip preamble
+    gp = 2
+    for _ in range(n):
+        ps = ptr8(pg[gp] + row * pg[gp + 2])
+        bc = pg[gp + 1]
+        gp += 3
+        if bc & 0x8000:  # Pre-expanded: copy bytes
+            for sp in range((bc & 0x7fff) << 1):
+                pd[dp] = ps[sp]
+                dp += 1
+            continue
+        mask = 0x80
+        sp = 0
+        for bit in range(bc):
+            one = ps[sp] & mask
+            pd[dp] = fgc0 if one else bgc0
+            dp += 1
+            pd[dp] = fgc1 if one else bgc1
+            dp += 1
+            mask >>= 1
+            if not mask:
+                mask = 0x80
+                sp += 1
+
+# Compact n RGB565 pixels (MSB first) in place to n RGB332 bytes for 8 bit
+# color depth.
+@micropython.viper
+def to332(pd : ptr8, n : int):
+    ps = 0
+    for pix in range(n):
+        b0 = pd[ps]  # RRRRRGGG
+        b1 = pd[ps + 1]  # GGGBBBBB
+        pd[pix] = (b0 & 0xe0) | ((b0 & 7) << 2) | ((b1 >> 3) & 3)
+        ps += 2
+
+# Touch sample filter. st is an array('i') holding filter state:
+# 0 median length n, 1 history index, 2 smoothing shift, 3 deadband,
+# 4, 5 smoothed x, y (8 fractional bits), 6, 7 reported x, y, 8 moving flag,
+# then x history, y history and sort workspace, each of _TMEDIAN entries.
+# A sample is passed through a median of the last n samples, exponential
+# smoothing, then a deadband: the reported position only changes when the
+# smoothed position moves more than deadband pixels, or more than half that
+# if it was moving. Returns 1 if the reported position changed. reset starts
+# a new touch, initialising state to the sample.
+@micropython.viper
+def tfilter(st : ptr32, x : int, y : int, reset : int) -> int:
+    n = int(st[0])
+    if reset:
+        for i in range(n):
+            st[9 + i] = x
+            st[9 + _TMEDIAN + i] = y
+        st[1] = 0
+        st[4] = x << 8
+        st[5] = y << 8
+        st[6] = x
+        st[7] = y
+        st[8] = 0
+        return 1
+    i = st[1]
+    st[9 + i] = x
+    st[9 + _TMEDIAN + i] = y
+    i += 1
+    st[1] = 0 if i >= n else i
+    tmp = 9 + 2 * _TMEDIAN
+    d = 0  # Max movement on either axis
+    for axis in range(2):
+        base = 9 + axis * _TMEDIAN
+        for j in range(n):  # Insertion sort
+            v = st[base + j]
+            k = j
+            while k > 0 and st[tmp + k - 1] > v:
+                st[tmp + k] = st[tmp + k - 1]
+                k -= 1
+            st[tmp + k] = v
+        m = int(st[tmp + (n >> 1)])  # Median
+        f = int(st[4 + axis])
+        f += ((m << 8) - f) >> int(st[2])
+        st[4 + axis] = f
+        delta = ((f + 128) >> 8) - int(st[6 + axis])
+        if delta < 0:
+            delta = 0 - delta
+        if delta > d:
+            d = delta
+    thr = int(st[3])
+    if st[8]:
+        thr >>= 1
+    if d <= thr:
+        st[8] = 0
+        return 0
+    st[8] = 1
+    st[6] = (st[4] + 128) >> 8
+    st[7] = (st[5] + 128) >> 8
+    return 1
+
+# Expand n RGB332 bytes in place to n RGB565 pixels (MSB first). The buffer
+# must hold 2 * n bytes.
+@micropython.viper
+def from332(pd : ptr8, n : int):
+    pix = n - 1
+    while pix >= 0:
+        c = pd[pix]
+        r = c >> 5
+        g = (c >> 2) & 7
+        b = c & 3
+        r = (r << 2) | (r >> 1)  # 5 bits
+        g = (g << 3) | g  # 6 bits
+        b = (b << 3) | (b << 1) | (b >> 1)  # 5 bits
+        pd[2 * pix] = (r << 3) | (g >> 3)
+        pd[2 * pix + 1] = ((g & 7) << 5) | b
+        pix -= 1
+
+# Convert n RGB565 pixels (MSB first) at ps to 24 bit pixels at pd. The byte
+# order is RGB or, if bgr is nonzero, BGR.
+@micropython.viper
+def to888(pd : ptr8, ps : ptr8, n : int, bgr : int):
+    for pix in range(n):
+        b0 = ps[2 * pix]
+        b1 = ps[2 * pix + 1]
+        r = b0 & 0xf8
+        g = ((b0 & 7) << 5) | ((b1 >> 3) & 0x1c)
+        b = (b1 & 0x1f) << 3
+        r |= r >> 5
+        g |= g >> 6
+        b |= b >> 5
+        if bgr:
+            pd[3 * pix] = b
+            pd[3 * pix + 2] = r
+        else:
+            pd[3 * pix] = r
+            pd[3 * pix + 2] = b
+        pd[3 * pix + 1] = g
+
+# Affine touch calibration. cal is an array('i') holding integer coefficients
+# a, b, c, d, e, f scaled by 2**16 followed by screen width and height. Returns
+# screen coordinates packed as x << 16 | y, clipped to the screen.
+@micropython.viper
+def affine(cal : ptr32, x : int, y : int) -> int:
+    xs = (int(cal[0]) * x + int(cal[1]) * y + int(cal[2])) >> 16
+    ys = (int(cal[3]) * x + int(cal[4]) * y + int(cal[5])) >> 16
+    w = int(cal[6])
+    h = int(cal[7])
+    if xs < 0:
+        xs = 0
+    elif xs >= w:
+        xs = w - 1
+    if ys < 0:
+        ys = 0
+    elif ys >= h:
+        ys = h - 1
+    return (xs << 16) | ys
+
+# Twice the signed area of triangle a, b, c: +ve if vertices are clockwise
+# in screen coordinates.
+def _cross(ax, ay, bx, by, cx, cy):
+    return (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+
 # SPI: Adafruit recommend 6MHz. Default polarity and phase (0)
 class RA8875:
     # colors: the GUI uses an (r, g, b) tuple of bytes. Panel uses RGB565.
@@ -66,7 +298,7 @@ class RA8875:
         r, g, b = rgb
         return (r & 0xf8) | ((g & 0xe0) >> 5) | ((g & 0x1c) << 11) | ((b & 0xf8) << 5)
 
-    def __init__(self, spi, pincs, pinrst, width, height, touch=True):
+    def __init__(self, spi, pincs, pinrst, width, height, touch=True, pinint=None):
         if (width, height) not in ((800, 480), (480, 272)):
             raise ValueError('Supported sizes are 800x480 and 480x272')
         self._spi = spi
@@ -75,20 +307,62 @@ class RA8875:
         self._width = width
         self._height = height
         self._touch_data = None
+        self._pinint = pinint  # Optional INT pin: touch is interrupt driven
+        self._touching = False  # Touch state maintained by ._dotouch
+        # Ring of touch events: type, x, y, ticks_ms
+        self._tev = array('i', (0 for _ in range(4 * _TEVENTS)))
+        self._tev_head = 0  # Index of oldest event
+        self._tev_n = 0  # No. of events in ring
+        self._tevt = asyncio.Event()  # Set when an event is added
+        self._tfilt = array('i', (0 for _ in range(9 + 3 * _TMEDIAN)))
+        self.touch_filter()
         # Default touchscreen calibration
         self._calibrated = False
-        self._xmin = 0
-        self._ymin = 0
-        self._xcal = 1
-        self._ycal = 1
+        self._tcal = array('i', (0, 0, 0, 0, 0, 0, width, height))
         # Buffers for optimised glyph rendering
         # Buffer to hold one line of largest permissible glyph
         self._mvlb = memoryview(bytearray(3 + 2 * MAX_CHAR_WIDTH))
         self._mvlb[0:3] = b'\x80\x02\x00'  # Preamble to line: memory write command
-        self._xl = bytearray(b'\x80\x46\x00\x00')
-        self._xh = bytearray(b'\x80\x47\x00\x00')
-        self._yl = bytearray(b'\x80\x48\x00\x00')
-        self._yh = bytearray(b'\x80\x49\x00\x00')
+        # Buffers for rendering strings as scanlines. Tabs are rendered as a
+        # glyph of zeros.
+        self._mvsb = memoryview(bytearray(3 + 2 * MAX_STR_WIDTH))
+        self._mvsb[0:3] = b'\x80\x02\x00'
+        self._glyphs = array('I', (0 for _ in range(2 + 3 * MAX_STR_CHARS)))
+        self._zeros = bytes(MAX_STR_WIDTH // 8 + 1)
+        self._grefs = [None] * MAX_STR_CHARS  # Retain cached glyphs during render
+        self._gcache = None  # Optional cache of expanded glyphs
+        # Batched register writes. Each slot holds RA8875_CMDWRITE, reg,
+        # RA8875_DATAWRITE, value and is sent in a single CS cycle.
+        mv = memoryview(bytearray(4 * _NREGS))
+        self._rslots = tuple(mv[n : n + 4] for n in range(0, 4 * _NREGS, 4))
+        for slot in self._rslots:
+            slot[0] = 0x80
+        self._nregs = 0  # No. of queued register writes
+        self._shadow = array('h', (-1 for _ in range(256)))  # -1: unknown
+        # Asynchronous drawing
+        self._alock = asyncio.Lock()
+        self._pending = None  # Status (reg, mask) of an incomplete async operation
+        self._windowed = False  # Active window is not full screen
+        # SPI baud rates for writes and reads. None: rate is not changed.
+        self._wbaud = None
+        self._rbaud = None
+        self._baud = None  # Current rate if set by driver
+        # Deferred drawing: ring buffer of command records
+        self._ops = (self._draw_rect, self._dcr, self._draw_circ, self._line,
+                     self._draw_tri, self._ellipse, self._bte_fill,
+                     self._bte_copy, self._clr)
+        self._ring = None
+        self._nslots = 0  # Capacity of ring in records
+        self._rhead = 0  # Index of oldest record
+        self._nrec = 0  # No. of records in ring
+        self._draining = False
+        self._devt = asyncio.Event()  # Set when records are added
+        self._dtask = None
+        # Two layer mode
+        self._dual = False
+        self._bpp8 = False  # 8 bit color depth (800x480 two layer mode)
+        self._wlayer = 0  # Layer written by host
+        self._slayer = 0  # Layer displayed
 
         self._reset()  # Strictly display should be powered down until reset is done
         self._set_pll(width, height)
@@ -100,14 +374,31 @@ class RA8875:
         self._write_reg(0x8A, 0x80 | 0x0a)  # RA8875_P1CR, RA8875_P1CR_ENABLE | RA8875_PWM_CLK_DIV1024
         self._write_reg(0x8B, 0xff)  # tft.PWM1out(255);
         if touch:
+            if pinint is not None:
+                self._tflag = asyncio.ThreadSafeFlag()
+                pinint.irq(trigger=pinint.IRQ_FALLING, handler=lambda _: self._tflag.set())
             asyncio.create_task(self._dotouch())
 
+    # Calibration from the touch coordinates of the top left and bottom right
+    # of the screen. Corrects scale and offset. Offsets include a rounding term
+    # as in cal.py.
     def calibrate(self, xmin, ymin, xmax, ymax):
+        a = ((self._width - 1) << 16) // (xmax - xmin)
+        e = ((self._height - 1) << 16) // (ymax - ymin)
+        self.calibrate_affine(a, 0, 32768 - a * xmin, 0, e, 32768 - e * ymin)
+
+    # Affine calibration which also corrects rotation and skew. Screen coords
+    # are xs = (a * x + b * y + c) >> 16 and ys = (d * x + e * y + f) >> 16
+    # where x, y are uncalibrated. cal.py computes the integer coefficients.
+    def calibrate_affine(self, a, b, c, d, e, f):
+        cal = self._tcal
+        cal[0] = a
+        cal[1] = b
+        cal[2] = c
+        cal[3] = d
+        cal[4] = e
+        cal[5] = f
         self._calibrated = True
-        self._xmin = xmin
-        self._ymin = ymin
-        self._xcal = (self._width - 1) / (xmax - xmin)
-        self._ycal = (self._height - 1) / (ymax - ymin)
 
     def _reset(self):
         self._pincs(1)
@@ -115,6 +406,14 @@ class RA8875:
         sleep_ms(2)
         self._pinrst(1)
         sleep_ms(20)
+        self.invalidate_regs()
+
+    # Discard the shadow copy of register contents. Must be called if registers
+    # are changed other than by this driver, e.g. after a hardware reset.
+    def invalidate_regs(self):
+        shadow = self._shadow
+        for n in range(256):
+            shadow[n] = -1
 
     # System clock: the crystal apperas to be 20MHz but the schematic is hard to read.
     # If so, the systam clock is 60MHz (value 0x0b) or 55MHz (value 0x0a)
@@ -176,22 +475,52 @@ class RA8875:
         # Clear the entire window
         self.clr_scr()
         sleep_ms(50)
-        self._write_reg(0x40, 0)  # Always in graphic mode
+        self._write_reg(0x40, 0)  # Graphic mode
 
     def _write_reg(self, reg, val):
-        self._pincs(0)
-        self._spi.write(b'\x80')  # RA8875_CMDWRITE
-        self._spi.write(int.to_bytes(reg, 1, 'little'))
-        self._pincs(1)  # min th = 90ns
-        self._pincs(0)
-        self._spi.write(b'\x00')  # RA8875_DATAWRITE
-        self._spi.write(int.to_bytes(val, 1, 'little'))
-        self._pincs(1)
+        self._queue_reg(reg, val)
+        self._send_regs()
+
+    # Add a register write to the batch. Caller must issue ._send_regs().
+    # The write is skipped if a shadowed register already holds the value.
+    # Any deferred commands are executed before an immediate transaction.
+    def _queue_reg(self, reg, val):
+        if self._nrec and not self._draining:
+            self.flush()
+        val &= 0xff
+        if _SHADOWED[reg]:
+            if self._shadow[reg] == val:
+                return
+            self._shadow[reg] = val
+        slot = self._rslots[self._nregs]
+        slot[1] = reg
+        slot[3] = val
+        self._nregs += 1
 
-    def _read_reg(self, reg, buf=bytearray(1)):
+    # Send all queued register writes. The RA8875 requires CS to be deasserted
+    # between register accesses but accepts the register number and its data
+    # in one CS cycle (min th = 90ns).
+    @micropython.native
+    def _send_regs(self):
+        if self._pending is not None:
+            self._finish()
+        if self._wbaud is not None and self._baud != self._wbaud:
+            self._set_baud(self._wbaud)
+        cs = self._pincs
+        write = self._spi.write
+        slots = self._rslots
+        for n in range(self._nregs):
+            cs(0)
+            write(slots[n])
+            cs(1)
+        self._nregs = 0
+
+    def _read_reg(self, reg, buf=bytearray(1), cmd=bytearray(b'\x80\x00')):
+        if self._rbaud is not None and self._baud != self._rbaud:
+            self._set_baud(self._rbaud)
+        cmd[1] = reg  # RA8875_CMDWRITE, reg
         self._pincs(0)
-        self._spi.write(b'\x80')  # RA8875_CMDWRITE
-        self._spi.write(int.to_bytes(reg, 1, 'little'))
+        self._spi.write(cmd)
         self._pincs(1)
         self._pincs(0)
         self._spi.write(b'\x40')  # RA8875_DATAREAD
@@ -199,10 +528,176 @@ class RA8875:
         self._pincs(1)
         return buf[0]
 
+    def _set_baud(self, baud):
+        self._spi.init(baudrate=baud)
+        self._baud = baud
+
+    # The RA8875 accepts writes at a higher SPI clock rate than it can be read.
+    # If rates are set the driver switches between them: all pixel and register
+    # writes start with ._send_regs, all reads use ._read_reg. Passing 0
+    # stops switching: the bus is left at the read rate, which is safe for
+    # both. Returns (write, read) or None.
+    def spi_rates(self, write=None, read=None):
+        if write is not None:
+            if not write:
+                if self._rbaud is not None:
+                    self._set_baud(self._rbaud)
+                self._wbaud = None
+                self._rbaud = None
+            else:
+                self._wbaud = write
+                self._rbaud = read if read else write
+                self._baud = None
+        return None if self._wbaud is None else (self._wbaud, self._rbaud)
+
+    # Find the fastest reliable write and read rates from a sequence of
+    # candidates by writing and reading back a BTE register. safe is a rate
+    # known to be reliable: writes are verified and reads are set up at this
+    # rate. Returns (write, read) for .spi_rates, which is called.
+    def tune_spi(self, rates=(6_000_000, 10_000_000, 15_000_000, 20_000_000,
+                              30_000_000, 40_000_000), safe=6_000_000):
+        self.flush()
+        if self._pending is not None:
+            self._finish()
+        self._wbaud = None  # Rates are set explicitly during the test
+        self._rbaud = None
+        buf = bytearray(b'\x80\x54\x00\x00')  # Write BTE source X LSB
+
+        def write(baud, val):
+            self._set_baud(baud)
+            buf[3] = val
+            self._pincs(0)
+            self._spi.write(buf)
+            self._pincs(1)
+
+        def read(baud):
+            self._set_baud(baud)
+            return self._read_reg(0x54)
+
+        def test(wbaud, rbaud):
+            for _ in range(10):
+                for val in (0x00, 0xff, 0x55, 0xaa, 0x5a, 0xa5, 0x0f, 0xf0):
+                    write(wbaud, val)
+                    if read(rbaud) != val:
+                        return False
+            return True
+
+        wbest = safe
+        for baud in sorted(rates):
+            if baud > safe:
+                if not test(baud, safe):
+                    break
+                wbest = baud
+        rbest = safe
+        for baud in sorted(rates):
+            if baud > safe:
+                if not test(safe, baud):
+                    break
+                rbest = baud
+        self.invalidate_regs()  # Register 0x54 was written directly
+        self.spi_rates(wbest, rbest)
+        return wbest, rbest
+
     def _wait_complete(self, reg=0x90, mask=0x80):
         while self._read_reg(reg) & mask:
             sleep_ms(1)
 
+    # Block until an operation started by ._arun has completed. Called before
+    # any register write so that synchronous methods can't disturb it.
+    def _finish(self):
+        self._wait_complete(*self._pending)
+        self._pending = None
+
+    # Start an operation and yield to the scheduler until the graphics engine
+    # has completed it. func returns the (reg, mask) status to poll.
+    async def _arun(self, func, *args):
+        async with self._alock:  # One asynchronous operation at a time
+            self._pending = status = func(*args)
+            reg, mask = status
+            # ._pending is cleared if a synchronous method waited for completion
+            while self._pending is not None and self._read_reg(reg) & mask:
+                await asyncio.sleep_ms(1)
+            self._pending = None
+
+    # **** DEFERRED DRAWING ****
+    # Synchronous graphics engine methods call ._run. In deferred mode the
+    # operation is recorded in a ring buffer and a task executes records in
+    # time slices, yielding while the graphics engine is busy. If the ring is
+    # full the oldest record is executed synchronously. Any other transaction
+    # (e.g. text or pixel data) first executes all pending records so that
+    # drawing order is preserved.
+
+    # Set the number of records in the ring buffer. 0 restores immediate mode.
+    # Returns the current size.
+    def defer(self, nrecords=None):
+        if nrecords is not None:
+            self.flush()
+            if nrecords > 0:
+                self._ring = array('i', (0 for _ in range(nrecords * _RECLEN)))
+                self._nslots = nrecords
+                self._rhead = 0
+                if self._dtask is None:
+                    self._dtask = asyncio.create_task(self._drain())
+            else:
+                self._ring = None
+                self._nslots = 0
+        return self._nslots
+
+    # Execute all deferred commands, blocking until complete
+    def flush(self):
+        while self._nrec:
+            self._wait_complete(*self._next())
+
+    def _run(self, op, *args):
+        if self._ring is None:
+            self._wait_complete(*self._ops[op](*args))
+            return
+        if self._nrec == self._nslots:  # Ring full: apply back-pressure
+            self._wait_complete(*self._next())
+        ring = self._ring
+        idx = ((self._rhead + self._nrec) % self._nslots) * _RECLEN
+        ring[idx] = op
+        ring[idx + 1] = len(args)
+        cpos = _CPOS[op]
+        for n, arg in enumerate(args):
+            if n == cpos:
+                r, g, b = arg
+                arg = (r & 0xff) << 16 | (g & 0xff) << 8 | (b & 0xff)
+            ring[idx + 2 + n] = int(arg)
+        self._nrec += 1
+        self._devt.set()
+
+    # Start the oldest deferred command. Return the status to poll.
+    def _next(self):
+        if not self._nrec:  # Emptied by .flush() while drain task waited
+            return _DCR_BUSY
+        ring = self._ring
+        idx = self._rhead * _RECLEN
+        op = ring[idx]
+        args = [ring[idx + 2 + n] for n in range(ring[idx + 1])]
+        cpos = _CPOS[op]
+        if cpos >= 0:
+            c = args[cpos]
+            args[cpos] = (c >> 16, (c >> 8) & 0xff, c & 0xff)
+        self._rhead = (self._rhead + 1) % self._nslots
+        self._nrec -= 1
+        self._draining = True
+        try:
+            return self._ops[op](*args)
+        finally:
+            self._draining = False
+
+    async def _drain(self):
+        while True:
+            await self._devt.wait()
+            self._devt.clear()
+            t = ticks_ms()
+            while self._nrec:
+                await self._arun(self._next)
+                if ticks_diff(ticks_ms(), t) >= _SLICE_MS:
+                    await asyncio.sleep_ms(0)
+                    t = ticks_ms()
+
     def width(self):
         return self._width
 
@@ -210,33 +705,78 @@ class RA8875:
         return self._height
 
     # **** GRAPHICS PRIMITIVES ****
+    # Internal methods start an operation and return the (reg, mask) status
+    # which indicates completion. Each public method has an asynchronous
+    # counterpart which yields to the scheduler while the graphics engine is
+    # busy, e.g. await tft.afill_rectangle(x1, y1, x2, y2, rgb)
 
     def clr_scr(self):  # Clear screen NOTE: does not always work as expected.
+        self._run(_OP_CLR)
+
+    async def aclr_scr(self):
+        await self._arun(self._clr)
+
+    def _clr(self):
         self._write_reg(0x8e, 0x80)
-        self._wait_complete(0x8e)
+        return _CLR_BUSY
 
-    # Given an (r, g, b) tuple, set the device's color registers
-    def _set_color(self, rgb):
+    # Given an (r, g, b) tuple, queue writes to the device's foreground (0x63)
+    # or text background (0x60) color registers
+    def _set_color(self, rgb, reg=0x63):
         r, g, b = rgb
-        self._write_reg(0x63, (r & 0xff) >> 3)  # R
-        self._write_reg(0x64, (g & 0xff) >> 2)  # G
-        self._write_reg(0x65, (b & 0xff) >> 3)  # B
+        if self._bpp8:  # RGB332
+            self._queue_reg(reg, (r & 0xff) >> 5)  # R
+            self._queue_reg(reg + 1, (g & 0xff) >> 5)  # G
+            self._queue_reg(reg + 2, (b & 0xff) >> 6)  # B
+        else:
+            self._queue_reg(reg, (r & 0xff) >> 3)  # R
+            self._queue_reg(reg + 1, (g & 0xff) >> 2)  # G
+            self._queue_reg(reg + 2, (b & 0xff) >> 3)  # B
+
+    # Queue graphic (0) or text (0x80) mode and a full screen active window.
+    # Text mode and a restricted window may have been left set by other
+    # methods: the writes are elided by the shadow registers if already set.
+    def _mode(self, mode=0):
+        self._queue_reg(0x40, mode)
+        if self._windowed:
+            self._set_window(0, 0, self._width - 1, self._height - 1)
+            self._windowed = False
+
+    # Queue active window registers
+    def _set_window(self, x1, y1, x2, y2):
+        self._queue_reg(0x30, x1 & 0xff)  # Horizontal start
+        self._queue_reg(0x31, x1 >> 8)
+        self._queue_reg(0x32, y1 & 0xff)  # Vertical start
+        self._queue_reg(0x33, y1 >> 8)
+        self._queue_reg(0x34, x2 & 0xff)  # Horizontal end
+        self._queue_reg(0x35, x2 >> 8)
+        self._queue_reg(0x36, y2 & 0xff)  # Vertical end
+        self._queue_reg(0x37, y2 >> 8)
+        self._windowed = True
+
+    # Queue memory write cursor registers
+    def _set_cursor(self, x, y):
+        self._queue_reg(0x46, x & 0xff)
+        self._queue_reg(0x47, x >> 8)
+        self._queue_reg(0x48, y & 0xff)
+        self._queue_reg(0x49, y >> 8)
 
-    # Set ends of line, rectangle, clipped rectangle
+    # Queue ends of line, rectangle, clipped rectangle.
     def _set_start_end(self, x1, y1, x2, y2):
         x1 = int(x1)
         y1 = int(y1)
         x2 = int(x2)
         y2 = int(y2)
-        self._write_reg(0x91, x1 & 0xff)  # Start
-        self._write_reg(0x92, x1 >> 8)
-        self._write_reg(0x93, y1 & 0xff)
-        self._write_reg(0x94, y1 >> 8)
+        self._mode()
+        self._queue_reg(0x91, x1 & 0xff)  # Start
+        self._queue_reg(0x92, x1 >> 8)
+        self._queue_reg(0x93, y1 & 0xff)
+        self._queue_reg(0x94, y1 >> 8)
 
-        self._write_reg(0x95, x2 & 0xff)  # End
-        self._write_reg(0x96, x2 >> 8)
-        self._write_reg(0x97, y2 & 0xff)
-        self._write_reg(0x98, y2 >> 8)
+        self._queue_reg(0x95, x2 & 0xff)  # End
+        self._queue_reg(0x96, x2 >> 8)
+        self._queue_reg(0x97, y2 & 0xff)
+        self._queue_reg(0x98, y2 >> 8)
 
     def draw_vline(self, x1, y1, l, rgb):
         self.draw_line(x1, y1, x1, y1 + l, rgb)
@@ -245,87 +785,541 @@ class RA8875:
         self.draw_line(x1, y1, x1 + l, y1, rgb)
 
     def draw_line(self, x1, y1, x2, y2, rgb):
+        self._run(_OP_LINE, x1, y1, x2, y2, rgb)
+
+    async def adraw_line(self, x1, y1, x2, y2, rgb):
+        await self._arun(self._line, x1, y1, x2, y2, rgb)
+
+    def _line(self, x1, y1, x2, y2, rgb):
         self._set_start_end(x1, y1, x2, y2)
         self._set_color(rgb)
+        self._queue_reg(0x90, 0)  # Draw draw_line
+        self._queue_reg(0x90, 0x80)  # Start draw
+        self._send_regs()
+        return _DCR_BUSY
 
-        self._write_reg(0x90, 0)  # Draw draw_line
-        self._write_reg(0x90, 0x80)  # Start draw
-        self._wait_complete()
+    # Draw connected lines through points: a sequence of x, y coordinate pairs
+    # such as an array('h'). The color is set once and the shadow registers
+    # ensure that only the changed coordinate bytes are sent for each segment.
+    def draw_polyline(self, points, rgb):
+        self._polyline(points, rgb)
+
+    def _polyline(self, points, rgb):
+        n = len(points)
+        if n < 4:
+            return
+        self._mode()
+        self._set_color(rgb)
+        x1 = points[0]
+        y1 = points[1]
+        for i in range(2, n - 1, 2):
+            x2 = points[i]
+            y2 = points[i + 1]
+            self._set_start_end(x1, y1, x2, y2)
+            self._queue_reg(0x90, 0)  # Draw line
+            self._queue_reg(0x90, 0x80)  # Start draw
+            self._send_regs()
+            self._wait_complete()
+            x1 = x2
+            y1 = y2
 
     def draw_rectangle(self, x1, y1, x2, y2, rgb):
-        self._draw_rect(x1, y1, x2, y2, rgb, False)
+        self._run(_OP_RECT, x1, y1, x2, y2, rgb, False)
 
     def fill_rectangle(self, x1, y1, x2, y2, rgb):
-        self._draw_rect(x1, y1, x2, y2, rgb, True)
+        self._run(_OP_RECT, x1, y1, x2, y2, rgb, True)
+
+    async def adraw_rectangle(self, x1, y1, x2, y2, rgb):
+        await self._arun(self._draw_rect, x1, y1, x2, y2, rgb, False)
+
+    async def afill_rectangle(self, x1, y1, x2, y2, rgb):
+        await self._arun(self._draw_rect, x1, y1, x2, y2, rgb, True)
 
     def _draw_rect(self, x1, y1, x2, y2, rgb, fill):
         self._set_start_end(x1, y1, x2, y2)
         self._set_color(rgb)
-
-        self._write_reg(0x90, 0xb0 if fill else 0x90)  # Draw rectangle
-        self._wait_complete()
+        self._queue_reg(0x90, 0xb0 if fill else 0x90)  # Draw rectangle
+        self._send_regs()
+        return _DCR_BUSY
 
     def draw_clipped_rectangle(self, x1, y1, x2, y2, rgb, radius=3):
-        self._dcr(x1, y1, x2, y2, rgb, radius, False)
+        self._run(_OP_DCR, x1, y1, x2, y2, rgb, radius, False)
 
     def fill_clipped_rectangle(self, x1, y1, x2, y2, rgb, radius=3):
-        self._dcr(x1, y1, x2, y2, rgb, radius, True)
+        self._run(_OP_DCR, x1, y1, x2, y2, rgb, radius, True)
+
+    async def adraw_clipped_rectangle(self, x1, y1, x2, y2, rgb, radius=3):
+        await self._arun(self._dcr, x1, y1, x2, y2, rgb, radius, False)
+
+    async def afill_clipped_rectangle(self, x1, y1, x2, y2, rgb, radius=3):
+        await self._arun(self._dcr, x1, y1, x2, y2, rgb, radius, True)
 
     def _dcr(self, x1, y1, x2, y2, rgb, radius, fill):
         self._set_start_end(x1, y1, x2, y2)
+        self._queue_reg(0xa1, radius & 0xff)  # LSB
+        self._queue_reg(0xa2, radius >> 8)  # MSB
+        self._queue_reg(0xa3, radius & 0xff)  # repeat radius
+        self._queue_reg(0xa4, radius >> 8)
+        self._set_color(rgb)
+        self._queue_reg(0xa0, 0xe0 if fill else 0xa0)  # Draw circle square
+        self._send_regs()
+        return _ELL_BUSY
+
+    # Ellipse with horizontal semi-axis a and vertical semi-axis b
+    def draw_ellipse(self, x, y, a, b, rgb):
+        self._run(_OP_ELL, x, y, a, b, rgb, 0x80)
+
+    def fill_ellipse(self, x, y, a, b, rgb):
+        self._run(_OP_ELL, x, y, a, b, rgb, 0xc0)
+
+    async def adraw_ellipse(self, x, y, a, b, rgb):
+        await self._arun(self._ellipse, x, y, a, b, rgb, 0x80)
+
+    async def afill_ellipse(self, x, y, a, b, rgb):
+        await self._arun(self._ellipse, x, y, a, b, rgb, 0xc0)
+
+    # One quadrant of an ellipse. part: 0 bottom left, 1 top left, 2 top right,
+    # 3 bottom right. A filled curve is a quadrant sector.
+    def draw_curve(self, x, y, a, b, part, rgb):
+        self._run(_OP_ELL, x, y, a, b, rgb, 0x90 | (part & 3))
+
+    def fill_curve(self, x, y, a, b, part, rgb):
+        self._run(_OP_ELL, x, y, a, b, rgb, 0xd0 | (part & 3))
+
+    def _ellipse(self, x, y, a, b, rgb, cmd):
+        x = int(x)
+        y = int(y)
+        a = int(a)
+        b = int(b)
+        self._mode()
+        self._queue_reg(0xa5, x & 0xff)  # Centre
+        self._queue_reg(0xa6, x >> 8)
+        self._queue_reg(0xa7, y & 0xff)
+        self._queue_reg(0xa8, y >> 8)
+        self._queue_reg(0xa1, a & 0xff)  # Long axis
+        self._queue_reg(0xa2, a >> 8)
+        self._queue_reg(0xa3, b & 0xff)  # Short axis
+        self._queue_reg(0xa4, b >> 8)
+        self._set_color(rgb)
+        self._queue_reg(0xa0, cmd)
+        self._send_regs()
+        return _ELL_BUSY
+
+    # Circular arc and pie segment. Angles are in radians: as in the Dial
+    # widget 0 is vertical and +ve increments are clockwise. Whole quadrants are
+    # drawn by the graphics engine, the remainder as short lines or triangles.
+    def draw_arc(self, x, y, r, start, end, rgb):
+        self._arc(x, y, r, start, end, rgb, False)
+
+    def fill_pie(self, x, y, r, start, end, rgb):
+        self._arc(x, y, r, start, end, rgb, True)
+
+    def _arc(self, x, y, r, start, end, rgb, fill):
+        s = start / _HALFPI  # Work in quadrants
+        e = end / _HALFPI
+        if e < s:
+            e += 4 * math.ceil((s - e) / 4)
+        e = min(e, s + 4)
+        while e - s > 1e-6:
+            q = math.floor(s + 1e-6)  # Current quadrant
+            n = min(e, q + 1)  # End of segment
+            if s - q < 1e-6 and q + 1 - n < 1e-6:  # Whole quadrant
+                # Quadrant 0 (top right) is curve part 2
+                cmd = (0xd0 if fill else 0x90) | ((q + 2) & 3)
+                self._run(_OP_ELL, x, y, r, r, rgb, cmd)
+            else:
+                self._sector(x, y, r, s * _HALFPI, n * _HALFPI, rgb, fill)
+            s = n
+
+    def _sector(self, x, y, r, start, end, rgb, fill):
+        nseg = max(int(r * (end - start) / _ARC_SEG), 1)
+        pts = array('h', (0 for _ in range(2 * nseg + 2)))
+        for i in range(nseg + 1):
+            theta = start + i * (end - start) / nseg
+            pts[2 * i] = round(x + r * math.sin(theta))
+            pts[2 * i + 1] = round(y - r * math.cos(theta))
+        if fill:
+            x = round(x)
+            y = round(y)
+            for i in range(0, 2 * nseg, 2):
+                self._run(_OP_TRI, x, y, pts[i], pts[i + 1], pts[i + 2], pts[i + 3], rgb, True)
+        else:
+            self._polyline(pts, rgb)
 
-        self._write_reg(0xa1, radius & 0xff)  # LSB
-        self._write_reg(0xa2, radius >> 8)  # MSB
-        self._write_reg(0xa3, radius & 0xff)  # repeat radius
-        self._write_reg(0xa4, radius >> 8)
+    def draw_triangle(self, x1, y1, x2, y2, x3, y3, rgb):
+        self._run(_OP_TRI, x1, y1, x2, y2, x3, y3, rgb, False)
 
+    def fill_triangle(self, x1, y1, x2, y2, x3, y3, rgb):
+        self._run(_OP_TRI, x1, y1, x2, y2, x3, y3, rgb, True)
+
+    async def adraw_triangle(self, x1, y1, x2, y2, x3, y3, rgb):
+        await self._arun(self._draw_tri, x1, y1, x2, y2, x3, y3, rgb, False)
+
+    async def afill_triangle(self, x1, y1, x2, y2, x3, y3, rgb):
+        await self._arun(self._draw_tri, x1, y1, x2, y2, x3, y3, rgb, True)
+
+    def _draw_tri(self, x1, y1, x2, y2, x3, y3, rgb, fill):
+        self._set_start_end(x1, y1, x2, y2)  # Points 0 and 1
+        x3 = int(x3)
+        y3 = int(y3)
+        self._queue_reg(0xa9, x3 & 0xff)  # Point 2
+        self._queue_reg(0xaa, x3 >> 8)
+        self._queue_reg(0xab, y3 & 0xff)
+        self._queue_reg(0xac, y3 >> 8)
         self._set_color(rgb)
+        self._queue_reg(0x90, 0xa1 if fill else 0x81)  # Draw triangle
+        self._send_regs()
+        return _DCR_BUSY
 
-        self._write_reg(0xa0, 0xe0 if fill else 0xa0)  # Draw circle square
-        self._wait_complete(0xa0)
+    # Fill a simple (non self-intersecting) polygon. points is a flat sequence
+    # of vertex coordinates x0, y0, x1, y1... The polygon is divided into
+    # triangles by ear clipping, each being filled by the graphics engine.
+    def fill_polygon(self, points, rgb):
+        idx = list(range(len(points) // 2))  # Remaining vertices
+        if len(idx) < 3:
+            return
+        px = points[0::2]
+        py = points[1::2]
+        area = 0  # Determine orientation
+        j = idx[-1]
+        for i in idx:
+            area += (px[j] - px[i]) * (py[j] + py[i])
+            j = i
+        sign = 1 if area > 0 else -1
+        while len(idx) > 3:
+            m = len(idx)
+            for k in range(m):
+                a = idx[k - 1]
+                b = idx[k]
+                c = idx[(k + 1) % m]
+                if sign * _cross(px[a], py[a], px[b], py[b], px[c], py[c]) <= 0:
+                    continue  # Reflex or degenerate vertex
+                for v in idx:  # An ear contains no other vertex
+                    if v != a and v != b and v != c \
+                        and sign * _cross(px[a], py[a], px[b], py[b], px[v], py[v]) >= 0 \
+                        and sign * _cross(px[b], py[b], px[c], py[c], px[v], py[v]) >= 0 \
+                        and sign * _cross(px[c], py[c], px[a], py[a], px[v], py[v]) >= 0:
+                        break
+                else:
+                    self._run(_OP_TRI, px[a], py[a], px[b], py[b], px[c], py[c], rgb, True)
+                    idx.pop(k)
+                    break
+            else:  # No ear: polygon is degenerate. Fill as a fan.
+                break
+        a = idx[0]
+        for k in range(1, len(idx) - 1):
+            b = idx[k]
+            c = idx[k + 1]
+            self._run(_OP_TRI, px[a], py[a], px[b], py[b], px[c], py[c], rgb, True)
 
     def draw_circle(self, x1, y1, r, rgb):
-        self._draw_circ(x1, y1, r, rgb, False)
+        self._run(_OP_CIRC, x1, y1, r, rgb, False)
 
     def fill_circle(self, x1, y1, r, rgb):
-        self._draw_circ(x1, y1, r, rgb, True)
+        self._run(_OP_CIRC, x1, y1, r, rgb, True)
+
+    async def adraw_circle(self, x1, y1, r, rgb):
+        await self._arun(self._draw_circ, x1, y1, r, rgb, False)
+
+    async def afill_circle(self, x1, y1, r, rgb):
+        await self._arun(self._draw_circ, x1, y1, r, rgb, True)
 
     def _draw_circ(self, x1, y1, radius, rgb, fill):
         x1 = int(x1)
         y1 = int(y1)
         radius = int(radius)
-        self._write_reg(0x99, x1 & 0xff)  # Centre
-        self._write_reg(0x9a, x1 >> 8)
-        self._write_reg(0x9b, y1 & 0xff)
-        self._write_reg(0x9c, y1 >> 8)
-
-        self._write_reg(0x9d, radius)
+        self._mode()
+        self._queue_reg(0x99, x1 & 0xff)  # Centre
+        self._queue_reg(0x9a, x1 >> 8)
+        self._queue_reg(0x9b, y1 & 0xff)
+        self._queue_reg(0x9c, y1 >> 8)
+        self._queue_reg(0x9d, radius)
         self._set_color(rgb)
+        self._queue_reg(0x90, 0x60 if fill else 0x40)
+        self._send_regs()
+        return _CIRC_BUSY
+
+    # **** BLOCK TRANSFER ENGINE ****
+    # Rectangles are specified by inclusive corners as in .fill_rectangle.
+    # layer args are 0 or 1 and are only meaningful in two layer mode.
+
+    # Copy a rectangle to destination xd, yd. Source and destination may
+    # overlap. rop specifies a raster operation combining source and destination.
+    def bte_copy(self, x1, y1, x2, y2, xd, yd, src_layer=0, dst_layer=0, rop=ROP_S):
+        self._run(_OP_BCOPY, x1, y1, x2, y2, xd, yd, src_layer, dst_layer, rop)
+
+    async def abte_copy(self, x1, y1, x2, y2, xd, yd, src_layer=0, dst_layer=0, rop=ROP_S):
+        await self._arun(self._bte_copy, x1, y1, x2, y2, xd, yd, src_layer, dst_layer, rop)
+
+    # Fill a rectangle with a solid color
+    def bte_fill(self, x1, y1, x2, y2, rgb, layer=0):
+        self._run(_OP_BFILL, x1, y1, x2, y2, rgb, layer)
+
+    async def abte_fill(self, x1, y1, x2, y2, rgb, layer=0):
+        await self._arun(self._bte_fill, x1, y1, x2, y2, rgb, layer)
+
+    # Move a rectangle to xd, yd filling the vacated area with rgb.
+    # Calls internal methods so that a subclass applying a color transform
+    # in bte_fill does not apply it twice.
+    def bte_move(self, x1, y1, x2, y2, xd, yd, rgb):
+        def fill(x1, y1, x2, y2):
+            self._run(_OP_BFILL, x1, y1, x2, y2, rgb, 0)
 
-        self._write_reg(0x90, 0x60 if fill else 0x40)
-        self._wait_complete(0x90, 0x40)
+        x1, x2 = min(x1, x2), max(x1, x2)
+        y1, y2 = min(y1, y2), max(y1, y2)
+        self._run(_OP_BCOPY, x1, y1, x2, y2, xd, yd, 0, 0, ROP_S)
+        dx = xd - x1
+        dy = yd - y1
+        if abs(dx) > x2 - x1 or abs(dy) > y2 - y1:  # No overlap
+            fill(x1, y1, x2, y2)
+            return
+        if dy > 0:  # Horizontal band uncovered by destination
+            fill(x1, y1, x2, y1 + dy - 1)
+            y1 += dy
+        elif dy < 0:
+            fill(x1, y2 + dy + 1, x2, y2)
+            y2 += dy
+        if dx > 0:  # Vertical band in the remaining rows
+            fill(x1, y1, x1 + dx - 1, y2)
+        elif dx < 0:
+            fill(x2 + dx + 1, y1, x2, y2)
+
+    # Queue BTE source, destination and size registers
+    def _bte_regs(self, xs, ys, src_layer, xd, yd, dst_layer, w, h):
+        self._mode()
+        self._queue_reg(0x54, xs & 0xff)  # Source
+        self._queue_reg(0x55, xs >> 8)
+        self._queue_reg(0x56, ys & 0xff)
+        self._queue_reg(0x57, (ys >> 8) | (0x80 if src_layer else 0))
+        self._queue_reg(0x58, xd & 0xff)  # Destination
+        self._queue_reg(0x59, xd >> 8)
+        self._queue_reg(0x5a, yd & 0xff)
+        self._queue_reg(0x5b, (yd >> 8) | (0x80 if dst_layer else 0))
+        self._queue_reg(0x5c, w & 0xff)  # Size
+        self._queue_reg(0x5d, w >> 8)
+        self._queue_reg(0x5e, h & 0xff)
+        self._queue_reg(0x5f, h >> 8)
+
+    def _bte_copy(self, x1, y1, x2, y2, xd, yd, src_layer, dst_layer, rop):
+        x1, x2 = int(min(x1, x2)), int(max(x1, x2))
+        y1, y2 = int(min(y1, y2)), int(max(y1, y2))
+        xd = int(xd)
+        yd = int(yd)
+        w = x2 - x1 + 1
+        h = y2 - y1 + 1
+        # An overlapping copy to a later position must run in the negative
+        # direction, starting from the bottom right hand corners.
+        if src_layer == dst_layer and (yd > y1 or (yd == y1 and xd > x1)):
+            self._bte_regs(x2, y2, src_layer, xd + w - 1, yd + h - 1, dst_layer, w, h)
+            self._queue_reg(0x51, (rop << 4) | 0x03)  # Move in negative direction
+        else:
+            self._bte_regs(x1, y1, src_layer, xd, yd, dst_layer, w, h)
+            self._queue_reg(0x51, (rop << 4) | 0x02)  # Move in positive direction
+        self._queue_reg(0x50, 0x80)  # Start
+        self._send_regs()
+        return _BTE_BUSY
+
+    def _bte_fill(self, x1, y1, x2, y2, rgb, layer):
+        x1, x2 = int(min(x1, x2)), int(max(x1, x2))
+        y1, y2 = int(min(y1, y2)), int(max(y1, y2))
+        self._bte_regs(x1, y1, layer, x1, y1, layer, x2 - x1 + 1, y2 - y1 + 1)
+        self._set_color(rgb)
+        self._queue_reg(0x51, (ROP_S << 4) | 0x0c)  # Solid fill
+        self._queue_reg(0x50, 0x80)  # Start
+        self._send_regs()
+        return _BTE_BUSY
 
     # **** PIXEL LEVEL PRIMITIVES ****
 
     # Draw single pixel
-    def draw_pixel(self, x, y, rgb):
-        self._write_reg(0x46, x & 0xff)  # Set xy for memory write cursor
-        self._write_reg(0x47, x >> 8)
-        self._write_reg(0x48, y & 0xff)
-        self._write_reg(0x49, y >> 8)
+    def draw_pixel(self, x, y, rgb, buf=bytearray(b'\x80\x02\x00\x00\x00')):
+        self._mode()
+        self._set_cursor(x, y)
+        self._send_regs()
+        c = RA8875._to_rgb565(rgb)
+        buf[3] = c & 0xff  # MSB 1st
+        buf[4] = c >> 8
+        mv = memoryview(buf)
+        if self._bpp8:
+            to332(mv[3:], 1)
+            mv = mv[:4]
         self._pincs(0)
-        self._spi.write(b'\x80\x02')  # RA8875_CMDWRITE
+        self._spi.write(mv)  # RA8875_CMDWRITE, MRWC, RA8875_DATAWRITE, pixel
         self._pincs(1)
+
+    # Write a w*h rectangle of pixels at x, y. Each pixel comprises two bytes:
+    # the RGB565 value MSB first as produced by _to_rgb565. buf may be a bytes,
+    # bytearray or memoryview holding the entire rectangle, an iterable yielding
+    # such buffers (e.g. one per row), or a stream with a readinto method. In
+    # the latter case one row is read at a time, allocating a row buffer.
+    # The active window is set to the rectangle, so the memory write cursor
+    # wraps at its right hand edge and all data is streamed as one memory write.
+    def blit(self, x, y, w, h, buf):
+        self._queue_reg(0x40, 0)  # Graphic mode
+        self._set_window(x, y, x + w - 1, y + h - 1)
+        self._set_cursor(x, y)
+        self._send_regs()
         self._pincs(0)
-        self._spi.write(b'\x00' + int.to_bytes(RA8875._to_rgb565(rgb), 2, 'little'))  # MSB 1st
+        self._spi.write(b'\x80\x02')  # RA8875_CMDWRITE, MRWC
+        self._pincs(1)
+        if isinstance(buf, (bytes, bytearray, memoryview)):
+            self._write_data(buf)
+        elif hasattr(buf, 'readinto'):
+            row = bytearray(2 * w)
+            for _ in range(h):
+                n = buf.readinto(row)
+                if not n:
+                    break
+                self._write_data(row if n == len(row) else memoryview(row)[:n])
+        else:
+            for chunk in buf:
+                self._write_data(chunk)
+
+    # Continue a memory write with a buffer of pixel data. At 8 bit color depth
+    # a compacted copy is sent to leave the caller's data intact.
+    def _write_data(self, buf):
+        if self._bpp8:
+            buf = bytearray(buf)
+            n = len(buf) >> 1
+            to332(buf, n)
+            buf = memoryview(buf)[:n]
+        self._pincs(0)
+        self._spi.write(b'\x00')  # RA8875_DATAWRITE
+        self._spi.write(buf)
         self._pincs(1)
 
+    # **** READBACK ****
+    # Display memory is read a row at a time: the read cursor is set, the
+    # memory read/write command is issued, then a data read returns a dummy
+    # byte followed by pixel data. Reads use the read SPI rate if set. The
+    # displayed layer is read: in two layer mode the layer register is
+    # switched for the read and restored afterwards.
+
+    # Read a row of w pixels at x, y into rbuf (at least 1 + 2 * w bytes).
+    # Returns a memoryview into rbuf of RGB565 data, MSB first, as for .blit.
+    def _read_row(self, x, y, w, rbuf):
+        swap = self._wlayer != self._slayer  # Read the displayed layer
+        self._mode()
+        if swap:
+            self._queue_reg(0x41, self._slayer)
+        self._queue_reg(0x4a, x & 0xff)  # Memory read cursor
+        self._queue_reg(0x4b, x >> 8)
+        self._queue_reg(0x4c, y & 0xff)
+        self._queue_reg(0x4d, y >> 8)
+        self._send_regs()
+        self._pincs(0)
+        self._spi.write(b'\x80\x02')  # RA8875_CMDWRITE, MRWC
+        self._pincs(1)
+        if self._rbaud is not None and self._baud != self._rbaud:
+            self._set_baud(self._rbaud)
+        n = w if self._bpp8 else 2 * w
+        self._pincs(0)
+        self._spi.write(b'\x40')  # RA8875_DATAREAD
+        self._spi.readinto(memoryview(rbuf)[: n + 1])  # Dummy byte then data
+        self._pincs(1)
+        if swap:  # Restore the layer selected by .write_layer
+            self._write_reg(0x41, self._wlayer)
+        pixels = memoryview(rbuf)[1 : 1 + 2 * w]
+        if self._bpp8:
+            from332(pixels, w)
+        return pixels
+
+    # Read a w*h rectangle of pixels at x, y into buf which must hold 2 * w * h
+    # bytes. The format is as for .blit.
+    def read_rect(self, x, y, w, h, buf):
+        rbuf = bytearray(1 + 2 * w)
+        rbytes = 2 * w
+        mv = memoryview(buf)
+        for row in range(h):
+            mv[row * rbytes : (row + 1) * rbytes] = self._read_row(x, y + row, w, rbuf)
+
+    # Write the screen to a stream (e.g. a file or UART) as a 24 bit BMP or a
+    # PPM file. Data is read, converted and written one row at a time.
+    def screenshot(self, stream, fmt='bmp'):
+        w = self._width
+        h = self._height
+        rbuf = bytearray(1 + 2 * w)
+        obuf = bytearray(3 * w + 3)  # Allow for BMP row padding
+        if fmt == 'bmp':
+            import struct
+            rsize = (3 * w + 3) & ~3  # Rows are padded to 4 byte boundary
+            stream.write(struct.pack('<2sIHHIIiiHHIIiiII', b'BM', 54 + rsize * h, 0, 0, 54,
+                                     40, w, h, 1, 24, 0, rsize * h, 2835, 2835, 0, 0))
+            row = memoryview(obuf)[: rsize]
+            for y in range(h - 1, -1, -1):  # Bottom up
+                to888(obuf, self._read_row(0, y, w, rbuf), w, 1)
+                stream.write(row)
+        elif fmt == 'ppm':
+            stream.write('P6\n{:d} {:d}\n255\n'.format(w, h).encode())
+            row = memoryview(obuf)[: 3 * w]
+            for y in range(h):
+                to888(obuf, self._read_row(0, y, w, rbuf), w, 0)
+                stream.write(row)
+        else:
+            raise ValueError('Format must be bmp or ppm.')
+
+    # Enable a cache of glyphs expanded to RGB565, limited to nbytes of RAM.
+    # 0 disables the cache. Returns the GlyphCache instance (or None) which has
+    # .hits and .misses counters.
+    def glyph_cache(self, nbytes=None):
+        if nbytes is not None:
+            if nbytes > 0:
+                from micropython_ra8875.driver.glyph_cache import GlyphCache
+                self._gcache = GlyphCache(nbytes)
+            else:
+                self._gcache = None
+        return self._gcache
+
+    # Return a cached, expanded glyph or None if not cacheable. gkey is a
+    # (font, char) tuple identifying the glyph.
+    def _cached(self, mv, rows, cols, fgcolor, bgcolor, gkey):
+        cache = self._gcache
+        n = 2 * rows * cols
+        if n > cache.nbytes:  # Too big to cache: don't allocate
+            return None
+        key = (gkey, fgcolor, bgcolor)
+        buf = cache.get(key)
+        if buf is None:
+            buf = bytearray(n)
+            rbytes = 2 * cols  # Bytes per expanded row
+            # lcopy skips a 3 byte preamble: offset destination accordingly
+            dest = addressof(buf) - 3
+            src = addressof(mv)
+            gbytes = ((cols - 1) >> 3) + 1  # Source bytes per row
+            on = RA8875._to_rgb565(fgcolor)
+            cx = RA8875._to_rgb565(bgcolor) | (cols << 16)
+            for _ in range(rows):
+                lcopy(src, dest, cx, on)
+                src += gbytes
+                dest += rbytes
+            if not cache.put(key, buf):
+                return None
+        return buf
+
     # Draw a glyph. Note mv is a memoryview into the horizontally mapped glyph.
-    # Caller must validate dimensions.
-    # Optimisation: don't deassert CS between writing register no. and writing
-    # the memory write command (\x00).
+    # Caller must validate dimensions. The glyph cache is only used if key, a
+    # hashable value identifying the glyph such as (font, char), is passed.
+    # The active window is set to the glyph's bounding box so that the memory
+    # write cursor wraps at the end of each row. All rows are then sent in one
+    # CS cycle. Optimisation: don't deassert CS between writing register no.
+    # and writing the memory write command (\x00).
     @micropython.native
-    def draw_glyph(self, mv, x, y, rows, cols, fgcolor, bgcolor):
+    def draw_glyph(self, mv, x, y, rows, cols, fgcolor, bgcolor, key=None):
+        bpp8 = self._bpp8
+        if self._gcache is None or bpp8 or key is None:
+            buf = None
+        else:
+            buf = self._cached(mv, rows, cols, fgcolor, bgcolor, key)
+        if buf is not None:
+            self._queue_reg(0x40, 0)  # Graphic mode
+            self._set_window(x, y, x + cols - 1, y + rows - 1)
+            self._set_cursor(x, y)
+            self._send_regs()
+            self._pincs(0)
+            self._spi.write(b'\x80\x02\x00')  # RA8875_CMDWRITE, MRWC, RA8875_DATAWRITE
+            self._spi.write(buf)
+            self._pincs(1)
+            return
         gbytes = ((cols - 1) >> 3) + 1  # Source bytes per row
         # Note that dest[0] is 0: the memory write command. Subsequent values are
         # 16 bit rgb565 color values for each pixel.
@@ -333,68 +1327,172 @@ class RA8875:
         # https://github.com/micropython/micropython/issues/4936 (use of addressof)
         # mv is a memoryview into a readonly (bytes) object.
         src = addressof(mv)
-        offs = 0  # Offset into source
         on = RA8875._to_rgb565(fgcolor)  # Integer (16 bit half word)
         cx = RA8875._to_rgb565(bgcolor) | (cols << 16)
-        xl = self._xl  # Cache the command buffers
-        xh = self._xh
-        yl = self._yl
-        yh = self._yh
-        xl[3] = x & 0xff
-        xh[3] = x >> 8
+        self._queue_reg(0x40, 0)  # Graphic mode
+        self._set_window(x, y, x + cols - 1, y + rows - 1)
+        self._set_cursor(x, y)
+        self._send_regs()
+        nbytes = 3 + (cols if bpp8 else 2 * cols)
+        # dest[0:3] holds b'\x80\x02\x00' RA8875_CMDWRITE, MRWC, RA8875_DATAWRITE
+        # populated by constructor. It precedes the first row only.
+        first = dest[: nbytes]
+        pixels = dest[3 : nbytes]
+        work = dest[3:]
+        write = self._spi.write
+        self._pincs(0)
         for row in range(rows):
-            # dest[0:3] holds b'\x80\x02\x00' RA8875_CMDWRITE, MRWC, RA8875_DATAWRITE
-            # populated by constructor.
             # lcopy populates dest[3:] with color value for each pixel in row.
-            lcopy(src + offs, dest, cx, on)
-            yl[3] = y & 0xff
-            yh[3] = y >> 8
-            self._pincs(0)
-            self._spi.write(xl)  # Fast register write
-            self._pincs(1)  # min th = 90ns
-            self._pincs(0)
-            self._spi.write(xh)
-            self._pincs(1)
-            self._pincs(0)
-            self._spi.write(yl)
-            self._pincs(1)
-            self._pincs(0)
-            self._spi.write(yh)
-            self._pincs(1)
-            self._pincs(0)
-            self._spi.write(dest[: 3 + 2*cols])
-            self._pincs(1)
-            y += 1
-            offs += gbytes
+            lcopy(src, dest, cx, on)
+            if bpp8:
+                to332(work, cols)
+            write(pixels if row else first)
+            src += gbytes
+        self._pincs(1)
+
+    # Render a string in a horizontally mapped Python font at x, y. Each pixel
+    # row of the entire string is expanded into a scanline buffer and the
+    # string's bounding box is written as one memory-write burst. Strings
+    # wider than the buffer are rendered in segments. Tab stops are at
+    # multiples of tab pixels: the space up to a stop is painted in bgcolor.
+    # Text is clipped at the right hand edge of the panel.
+    def draw_text(self, s, x, y, font, fgcolor, bgcolor, tab=32):
+        glyphs = self._glyphs
+        cache = self._gcache
+        grefs = self._grefs
+        glyphs[0] = RA8875._to_rgb565(fgcolor)
+        glyphs[1] = RA8875._to_rgb565(bgcolor)
+        rows = font.height()
+        xs = x  # Start of segment
+        n = 0  # No. of glyphs in segment
+        gp = 2
+        xmax = self._width  # Clip at right hand edge
+        for c in s:
+            if x >= xmax:
+                break
+            if c == '\t':  # _zeros holds one row of MAX_STR_WIDTH pixels
+                cols = min(tab - x % tab, MAX_STR_WIDTH)
+                addr = addressof(self._zeros)
+                stride = 0
+                buf = None
+            else:
+                mv, rows, cols = font.get_ch(c)
+                buf = None if cache is None else self._cached(mv, rows, cols, fgcolor, bgcolor, (font, c))
+                if buf is None:
+                    addr = addressof(mv)
+                    stride = ((cols - 1) >> 3) + 1
+                else:
+                    addr = addressof(buf)
+                    stride = 2 * cols
+            if n and (n == MAX_STR_CHARS or x + cols - xs > MAX_STR_WIDTH):
+                self._draw_segment(n, xs, y, x - xs, rows)
+                xs = x
+                n = 0
+                gp = 2
+            if cols > 0:
+                glyphs[gp] = addr
+                glyphs[gp + 1] = cols if buf is None else cols | 0x8000
+                glyphs[gp + 2] = stride
+                grefs[n] = buf  # Prevent GC of a glyph evicted from the cache
+                gp += 3
+                n += 1
+                x += cols
+        if n:
+            self._draw_segment(n, xs, y, min(x, xmax) - xs, rows)
+        if cache is not None:
+            for i in range(MAX_STR_CHARS):
+                grefs[i] = None
+
+    @micropython.native
+    def _draw_segment(self, n, x, y, width, rows):
+        dest = self._mvsb
+        glyphs = self._glyphs
+        self._queue_reg(0x40, 0)  # Graphic mode
+        self._set_window(x, y, x + width - 1, y + rows - 1)
+        self._set_cursor(x, y)
+        self._send_regs()
+        bpp8 = self._bpp8
+        nbytes = 3 + (width if bpp8 else 2 * width)
+        first = dest[: nbytes]  # Preamble precedes first row only
+        pixels = dest[3 : nbytes]
+        work = dest[3:]
+        write = self._spi.write
+        self._pincs(0)
+        for row in range(rows):
+            scopy(dest, glyphs, n, row)
+            if bpp8:
+                to332(work, width)
+            write(pixels if row else first)
+        self._pincs(1)
 
     def draw_str(self, s, x, y, fgcolor, bgcolor, scale=0):
-        self._write_reg(0x40, 0x80)  # Text mode
-        self._write_reg(0x21, 0)  # Internal font ROM, ISO/IEC 8859-1
+        self._mode(0x80)  # Text mode
+        self._queue_reg(0x21, 0)  # Internal font ROM, ISO/IEC 8859-1
         scale = min(3, max(scale, 0))
         scale |= scale << 2
-        self._write_reg(0x22, scale)
-        self._write_reg(0x2a, x & 0xff)
-        self._write_reg(0x2b, x >> 8)
-        self._write_reg(0x2c, y & 0xff)
-        self._write_reg(0x2d, y >> 8)
+        self._queue_reg(0x22, scale)
+        self._queue_reg(0x2a, x & 0xff)
+        self._queue_reg(0x2b, x >> 8)
+        self._queue_reg(0x2c, y & 0xff)
+        self._queue_reg(0x2d, y >> 8)
         self._set_color(fgcolor)
-        # BG color for text
-        r, g, b = bgcolor
-        self._write_reg(0x60, (r & 0xff) >> 3)  # R
-        self._write_reg(0x61, (g & 0xff) >> 2)  # G
-        self._write_reg(0x62, (b & 0xff) >> 3)  # B
-        self._pincs(0)
-        self._spi.write(b'\x80\x02')  # RA8875_CMDWRITE
-        self._pincs(1)
-        for char in s:
+        self._set_color(bgcolor, 0x60)  # BG color for text
+        self._send_regs()
+        if scale:  # Scaled characters need time to render (as per Adafruit)
+            self._pincs(0)
+            self._spi.write(b'\x80\x02')  # RA8875_CMDWRITE, MRWC
+            self._pincs(1)
+            for char in s:
+                self._pincs(0)
+                self._spi.write(b'\x00')  # RA8875_DATAWRITE
+                self._spi.write(char)
+                self._pincs(1)
+                sleep_ms(1)
+        else:  # Stream the entire string in one CS cycle
             self._pincs(0)
-            self._spi.write('\x00')
-            self._spi.write(char)
+            self._spi.write(b'\x80\x02\x00')  # RA8875_CMDWRITE, MRWC, RA8875_DATAWRITE
+            self._spi.write(s)
             self._pincs(1)
-            scale and sleep_ms(1)  # As per Adafruit
+        # Text mode is retained: graphics primitives restore graphic mode. This
+        # avoids toggling register 0x40 when strings are drawn consecutively.
 
-        self._write_reg(0x40, 0)  # Always leave in graphic mode
 
+    # **** LAYERS ****
+    # In two layer mode the host writes to one layer while either may be
+    # displayed. Display memory holds two 480x272 layers at 16 bits/pixel but
+    # at 800x480 only two layers at 8 bits/pixel, so color depth is reduced
+    # to RGB332 while the mode is active. Host pixel data remains RGB565 and
+    # is converted by the driver. Changing mode clears the display.
+    def dual_layer(self, enable=None):
+        if enable is not None:
+            enable = bool(enable)
+            self._bpp8 = enable and self._width == 800
+            self._write_reg(0x10, 0 if self._bpp8 else 0x0c)  # Color depth
+            self._write_reg(0x20, 0x80 if enable else 0)
+            self._dual = enable
+            self.show_layer(0)
+            for layer in ((1, 0) if enable else (0,)):
+                self.write_layer(layer)
+                self._wait_complete(*self._draw_rect(0, 0, self._width - 1, self._height - 1, (0, 0, 0), True))
+        return self._dual
+
+    # Select the layer (0 or 1) written by subsequent drawing operations
+    def write_layer(self, layer=None):
+        if layer is not None:
+            if layer and not self._dual:
+                raise ValueError('Two layer mode is not enabled.')
+            self._wlayer = layer & 1
+            self._write_reg(0x41, self._wlayer)
+        return self._wlayer
+
+    # Select the displayed layer
+    def show_layer(self, layer=None):
+        if layer is not None:
+            if layer and not self._dual:
+                raise ValueError('Two layer mode is not enabled.')
+            self._slayer = layer & 1
+            self._write_reg(0x52, self._slayer)  # Only the selected layer is visible
+        return self._slayer
 
     # **** TOUCH PANEL ****
 
@@ -406,26 +1504,82 @@ class RA8875:
     # Reading MSB of reg 0x74 doesn't work, nor does reading status register.
     # The only way seems to be to check the interrupt, which relies on there
     # being a coro which issues .get_touch to clear down the interrupt.
+    # The state maintained by ._dotouch is returned, avoiding SPI traffic.
     def touched(self):
-        return self._read_reg(0xf1) & 0x04  # This is how Adafruit do it.
+        return self._touching
 
     # Caller tests for .ready() before calling.
     def get_touch(self):  # Read data and invalidate ready
         d = None
         if self._touch_data is not None:
-            self._write_reg(0xf1, 0x04)  # Clear interrupt
+            self._tp_reg(0xf1, 0x04)  # Clear interrupt
             d = self._touch_data
             self._touch_data = None
         return d
 
-    # Given raw touch values return calibrated values guaranteed to lie
-    # within screen coordinates
-    def _tdata(self, x, y):
-        x = int(max(min((x - self._xmin) * self._xcal, self._width -1), 0))
-        y = int(max(min((y - self._ymin) * self._ycal, self._height - 1), 0))
-        return x, y
+    # Write a touch panel register immediately. Touch registers are independent
+    # of drawing so deferred commands need not be executed first.
+    def _tp_reg(self, reg, val, buf=bytearray(b'\x80\x00\x00\x00')):
+        if self._wbaud is not None and self._baud != self._wbaud:
+            self._set_baud(self._wbaud)
+        buf[1] = reg  # RA8875_CMDWRITE, reg, RA8875_DATAWRITE, val
+        buf[3] = val
+        self._pincs(0)
+        self._spi.write(buf)
+        self._pincs(1)
+
+    # Configure touch filtering: median of the last median (1-7) samples,
+    # exponential smoothing where each sample has a weight of 2**-shift (0-6),
+    # and a deadband in pixels. The defaults apply no filtering.
+    def touch_filter(self, median=1, shift=0, deadband=0):
+        if not 1 <= median <= _TMEDIAN or not 0 <= shift <= 6 or deadband < 0:
+            raise ValueError('Invalid touch filter argument.')
+        st = self._tfilt
+        st[0] = median
+        st[2] = shift
+        st[3] = deadband
+
+    # Return the oldest touch event as a (type, x, y, ticks_ms) tuple, or None
+    # if there are none. type is TOUCH_DOWN, TOUCH_MOVE or TOUCH_UP.
+    def get_event(self):
+        if not self._tev_n:
+            return None
+        ev = self._tev
+        idx = self._tev_head * 4
+        self._tev_head = (self._tev_head + 1) % _TEVENTS
+        self._tev_n -= 1
+        return ev[idx], ev[idx + 1], ev[idx + 2], ev[idx + 3]
+
+    # Pause until a touch event is available
+    async def touch_event(self):
+        while not self._tev_n:
+            self._tevt.clear()
+            await self._tevt.wait()
+
+    # Add an event to the ring. A move replaces an unconsumed move so a slow
+    # consumer sees the latest position. If the ring is full the oldest event
+    # is discarded.
+    def _tpush(self, kind, x, y):
+        ev = self._tev
+        n = self._tev_n
+        if n and kind == TOUCH_MOVE and ev[((self._tev_head + n - 1) % _TEVENTS) * 4] == TOUCH_MOVE:
+            n -= 1  # Coalesce
+        elif n == _TEVENTS:
+            self._tev_head = (self._tev_head + 1) % _TEVENTS
+            n -= 1
+        idx = ((self._tev_head + n) % _TEVENTS) * 4
+        ev[idx] = kind
+        ev[idx + 1] = x
+        ev[idx + 2] = y
+        ev[idx + 3] = ticks_ms()
+        self._tev_n = n + 1
+        self._tevt.set()
 
-    # Task monitors touch panel and stores data
+    # Task monitors touch panel, stores data and queues events. The interrupt
+    # is cleared after each sample. Release is signified by several consecutive
+    # samples without touch. If an INT pin was supplied, while untouched the
+    # task waits on the pin interrupt and during a touch the panel is sampled
+    # at a higher rate.
     async def _dotouch(self):
         self._write_reg(0xf1, 0x04)  # Clear TP interrupt
         # Enable touch panel. 4096 clocks for data ready. ADC clock is sysclock /16 for
@@ -434,9 +1588,14 @@ class RA8875:
         self._write_reg(0x70, 0xb0 | adcclock)
         self._write_reg(0x71, 0x04)  # Auto mode, debounce on
         self._write_reg(0xf0, 0x04)  # Enable TP interrupt
+        irq = self._pinint is not None
+        misses = 0  # Consecutive samples without touch
+        x = 0
+        y = 0
         while True:
             lb = self._read_reg(0xf1)
             if lb & 0x04:  # Touched
+                misses = 0
                 lx = lb & 3  # Get LS 2 bits of x and y
                 ly = (lb & 0x0c) >> 2
                 # Combine MSB and LS 2 bits
@@ -444,5 +1603,24 @@ class RA8875:
                 x = ((self._read_reg(0x72) << 2) | lx) * self._width >> 10
                 y = ((self._read_reg(0x73) << 2) | ly) * self._height >> 10
                 # If uncalibrated return raw data so user can calibrate
-                self._touch_data = self._tdata(x, y) if self._calibrated else (x, y)
-            await asyncio.sleep_ms(30)
+                if self._calibrated:  # Coordinates guaranteed to lie within screen
+                    x = affine(self._tcal, x, y)
+                    y = x & 0xffff
+                    x >>= 16
+                self._tp_reg(0xf1, 0x04)  # Clear interrupt
+                st = self._tfilt
+                if tfilter(st, x, y, 0 if self._touching else 1):  # Position has changed
+                    self._touch_data = (st[6], st[7])
+                    self._tpush(TOUCH_MOVE if self._touching else TOUCH_DOWN, st[6], st[7])
+                x = st[6]  # Filtered position
+                y = st[7]
+                self._touching = True
+            elif self._touching:
+                misses += 1
+                if misses >= _TRELEASE:
+                    self._touching = False
+                    self._tpush(TOUCH_UP, x, y)  # Last touched location
+            if irq and not self._touching:  # No bus traffic until touched
+                await self._tflag.wait()
+            else:
+                await asyncio.sleep_ms(_TFAST_MS if irq else _TPOLL_MS)
@@ -0,0 +1,41 @@
+# spitune.py SPI baud rate tuning utility for ra8875 driver.
+
+# Released under the MIT License (MIT). See LICENSE.
+# Copyright (c) 2019-2020 Peter Hinch
+
+# Finds the fastest reliable SPI write and read rates for this hardware and
+# optionally records them in tft_local.py.
+
+import uos as os
+import sys
+from micropython_ra8875.driver.tft_local import setup
+
+tft = setup(True, False)
+tft.spi_rates(0)  # Test from the rate set by setup (6MHz)
+print('Testing SPI rates...')
+wbaud, rbaud = tft.tune_spi()
+print('Write {:d}Hz read {:d}Hz'.format(wbaud, rbaud))
+if not input('Keep these rates (y/n)? ').lower() == 'y':
+    print('No changes made. Quitting.')
+    sys.exit(0)
+
+source = 'micropython_ra8875/driver/tft_local.py'
+temp = 'micropython_ra8875/driver/tft_local.bak'
+try:
+    with open(source, 'r') as fr, open(temp, 'w') as fw:
+        for line in fr:
+            if line.startswith('_SPI_RATES'):
+                line = '_SPI_RATES = ({:d}, {:d})  # Auto updated by spitune.py\n'.format(wbaud, rbaud)
+            fw.write(line)
+except OSError:
+    print('Could not open {:s} for reading or {:s} for writing.'.format(source, temp))
+    sys.exit(1)
+
+try:
+    os.remove(source)
+    os.rename(temp, source)
+except OSError:
+    print('Could not replace {:s} with {:s}.'.format(source, temp))
+    sys.exit(1)
+
+print('Successfully updated your SPI rates.')
@@ -12,7 +12,7 @@
 
 import uasyncio as asyncio
 from micropython_ra8875.primitives.delay_ms import Delay_ms
-from micropython_ra8875.driver.ra8875 import RA8875
+from micropython_ra8875.driver.ra8875 import RA8875, TOUCH_UP
 from micropython_ra8875.py.ugui import Screen
 from micropython_ra8875.py.colors import *
 from micropython_ra8875.driver.constants import *
@@ -27,8 +27,8 @@ class TFT(RA8875):
             hor += cols
         return hor, vert
 
-    def __init__(self, spi, pincs, pinrst, width, height, tdelay, touch):
-        super().__init__(spi, pincs, pinrst, width, height, touch)
+    def __init__(self, spi, pincs, pinrst, width, height, tdelay, touch, pinint=None):
+        super().__init__(spi, pincs, pinrst, width, height, touch, pinint)
         self.tdelay = tdelay  # Touch mode
         self._is_grey = False  # Not greyed-out
         self.dim(2)  # Default grey-out: dim colors by factor of 2
@@ -55,13 +55,7 @@ class TFT(RA8875):
         if isinstance(font, IFont):  # Internal font
             self.draw_str(s, x, y, fgc, bgc, font.scale())
         else:
-            for c in s:
-                if c == '\t':
-                    x += tab - x % tab
-                else:
-                    fmv, rows, cols = font.get_ch(c)
-                    self.draw_glyph(fmv, x, y, rows, cols, fgc, bgc)
-                    x += cols
+            self.draw_text(s, x, y, font, fgc, bgc, tab)
 
     def print_centered(self, x, y, s, style):
         font = style[2]
@@ -129,31 +123,112 @@ class TFT(RA8875):
     def draw_line(self, x1, y1, x2, y2, color):
         super().draw_line(x1, y1, x2, y2, self._getcolor(color))
 
+    def draw_triangle(self, x1, y1, x2, y2, x3, y3, color):
+        super().draw_triangle(x1, y1, x2, y2, x3, y3, self._getcolor(color))
+
+    def fill_triangle(self, x1, y1, x2, y2, x3, y3, color):
+        super().fill_triangle(x1, y1, x2, y2, x3, y3, self._getcolor(color))
+
+    def fill_polygon(self, points, color):
+        super().fill_polygon(points, self._getcolor(color))
+
+    def draw_ellipse(self, x, y, a, b, color):
+        super().draw_ellipse(x, y, a, b, self._getcolor(color))
+
+    def fill_ellipse(self, x, y, a, b, color):
+        super().fill_ellipse(x, y, a, b, self._getcolor(color))
+
+    def draw_curve(self, x, y, a, b, part, color):
+        super().draw_curve(x, y, a, b, part, self._getcolor(color))
+
+    def fill_curve(self, x, y, a, b, part, color):
+        super().fill_curve(x, y, a, b, part, self._getcolor(color))
+
+    def draw_arc(self, x, y, radius, start, end, color):
+        super().draw_arc(x, y, radius, start, end, self._getcolor(color))
+
+    def fill_pie(self, x, y, radius, start, end, color):
+        super().fill_pie(x, y, radius, start, end, self._getcolor(color))
+
+    def draw_polyline(self, points, color):
+        super().draw_polyline(points, self._getcolor(color))
+
+    def bte_fill(self, x1, y1, x2, y2, color, layer=0):
+        super().bte_fill(x1, y1, x2, y2, self._getcolor(color), layer)
+
+    def bte_move(self, x1, y1, x2, y2, xd, yd, color):
+        super().bte_move(x1, y1, x2, y2, xd, yd, self._getcolor(color))
+
+    # Asynchronous versions yield to the scheduler while the chip is busy
+    async def aclr_scr(self):
+        await super().afill_rectangle(0, 0, self.width() -1, self.height() -1, BLACK)
+
+    async def adraw_rectangle(self, x1, y1, x2, y2, color):
+        await super().adraw_rectangle(x1, y1, x2, y2, self._getcolor(color))
+
+    async def afill_rectangle(self, x1, y1, x2, y2, color):
+        await super().afill_rectangle(x1, y1, x2, y2, self._getcolor(color))
+
+    async def adraw_clipped_rectangle(self, x1, y1, x2, y2, color):
+        await super().adraw_clipped_rectangle(x1, y1, x2, y2, self._getcolor(color))
+
+    async def afill_clipped_rectangle(self, x1, y1, x2, y2, color):
+        await super().afill_clipped_rectangle(x1, y1, x2, y2, self._getcolor(color))
+
+    async def adraw_circle(self, x, y, radius, color):
+        await super().adraw_circle(x, y, radius, self._getcolor(color))
+
+    async def afill_circle(self, x, y, radius, color):
+        await super().afill_circle(x, y, radius, self._getcolor(color))
+
+    async def adraw_line(self, x1, y1, x2, y2, color):
+        await super().adraw_line(x1, y1, x2, y2, self._getcolor(color))
+
+    async def adraw_triangle(self, x1, y1, x2, y2, x3, y3, color):
+        await super().adraw_triangle(x1, y1, x2, y2, x3, y3, self._getcolor(color))
+
+    async def afill_triangle(self, x1, y1, x2, y2, x3, y3, color):
+        await super().afill_triangle(x1, y1, x2, y2, x3, y3, self._getcolor(color))
+
+    async def adraw_ellipse(self, x, y, a, b, color):
+        await super().adraw_ellipse(x, y, a, b, self._getcolor(color))
+
+    async def afill_ellipse(self, x, y, a, b, color):
+        await super().afill_ellipse(x, y, a, b, self._getcolor(color))
+
+    async def abte_fill(self, x1, y1, x2, y2, color, layer=0):
+        await super().abte_fill(x1, y1, x2, y2, self._getcolor(color), layer)
+
+    # Consume touch events from the driver. Touches and moves are passed to
+    # touchable objects; on release those which were touched are notified.
     async def touchtest(self): # Singleton task tests all touchable instances
         td = self.tdelay  # Delay in ms (0 is normal mode)
         x = 0  # Current touch coords
         y = 0
-        def dotouch():
-            tl = Screen.current_screen.touchlist
-            ids = id(Screen.current_screen)
-            for obj in iter(a for a in tl if a.visible and not a.greyed_out()):
-                obj._trytouch(x, y)  # Run user callback if touched
-                if ids != id(Screen.current_screen):  # cb may have changed screen
-                    break
+        def dotouch():  # Test only objects in the touch index cell
+            cs = Screen.current_screen
+            for obj in cs._candidates(x, y):
+                if obj.visible and not obj.greyed_out():
+                    obj._trytouch(x, y)  # Run user callback if touched
+                    if cs is not Screen.current_screen:  # cb may have changed screen
+                        break
         if td:
             tdelay = Delay_ms(func = dotouch, duration = td)
         while True:
-            await asyncio.sleep_ms(0)
-            if self.ready():
-                x, y = self.get_touch()
-                if td:
+            await self.touch_event()
+            while True:
+                ev = self.get_event()
+                if ev is None:
+                    break
+                kind, x, y, _ = ev
+                if kind == TOUCH_UP:
+                    tl = Screen.current_screen.touchlist
+                    for obj in iter(a for a in tl if a.was_touched):
+                        obj.was_touched = False # Call _untouched once only
+                        obj.busy = False
+                        obj._untouched()
+                elif td:
                     if not tdelay():
                         tdelay.trigger()
                 else:
                     dotouch()  # Process immediately
-            elif not self.touched():
-                tl = Screen.current_screen.touchlist
-                for obj in iter(a for a in tl if a.was_touched):
-                    obj.was_touched = False # Call _untouched once only
-                    obj.busy = False
-                    obj._untouched()
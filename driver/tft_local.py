@@ -19,8 +19,12 @@ _HEIGHT = const(272)
 _SPI = const(2)
 _RESET = 'X4'
 _CS = 'X5'
+# Optional: pin connected to RA8875 INT for interrupt driven touch, else None
+_INT = None
 # 0==normal, >0, e.g. 200 == reduce flicker (see docs)
 _TOUCH_DELAY = const(0)
+# SPI (write, read) baud rates or None to use 6MHz throughout
+_SPI_RATES = None  # *** To be updated by spitune.py ***
 # *****************
 
 def setup(driver_test=False, use_async=True):
@@ -29,15 +33,21 @@ def setup(driver_test=False, use_async=True):
     pinrst = Pin(_RESET, Pin.OUT, value=1)
     pincs = Pin(_CS, Pin.OUT, value=1)
     spi = SPI(_SPI, baudrate=6_000_000)  # Max that is reliable
+    pinint = None if _INT is None else Pin(_INT, Pin.IN, Pin.PULL_UP)
     if driver_test:
         from micropython_ra8875.driver.ra8875 import RA8875
-        return RA8875(spi, pincs, pinrst, _WIDTH, _HEIGHT, use_async)
+        tft = RA8875(spi, pincs, pinrst, _WIDTH, _HEIGHT, use_async, pinint)
+        if _SPI_RATES is not None:
+            tft.spi_rates(*_SPI_RATES)
+        return tft
 
     from micropython_ra8875.py.ugui import Screen
     from micropython_ra8875.driver.tft import TFT
-    tft = TFT(spi, pincs, pinrst, _WIDTH, _HEIGHT, _TOUCH_DELAY, True)
-    # Touch panel calibration values xmin, ymin, xmax, ymax
-    # See docs for calibration procedure
+    tft = TFT(spi, pincs, pinrst, _WIDTH, _HEIGHT, _TOUCH_DELAY, True, pinint)
+    if _SPI_RATES is not None:
+        tft.spi_rates(*_SPI_RATES)
+    # Touch panel calibration: values xmin, ymin, xmax, ymax or
+    # .calibrate_affine coefficients. See docs for calibration procedure
     tft.calibrate(25, 25, 459, 243)  # *** To be updated by cal.py ***
     Screen.setup(tft, tft)
 
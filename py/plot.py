@@ -23,6 +23,8 @@ _XMAX = const(1)
 _XMIN = const(-1)
 _YMAX = const(1)
 _YMIN = const(-1)
+# Max no. of points in a polyline
+_NPOINTS = const(64)
 
 
 class Curve():
@@ -100,11 +102,15 @@ class Curve():
         self.graph.addcurve(self) # May have been removed by clear()
         self.lastpoint = None
         if self.populate is not None:
-            pop = self.populate(self, *self.args)
-            if isinstance(pop, type_gen):
-                # populate was a generator function, pop is a generator.
-                for x, y in pop:
-                    self.point(x, y)
+            self.graph._start()  # Render connected lines as polylines
+            try:
+                pop = self.populate(self, *self.args)
+                if isinstance(pop, type_gen):
+                    # populate was a generator function, pop is a generator.
+                    for x, y in pop:
+                        self.point(x, y)
+            finally:
+                self.graph._flush()
 
     def _scale(self, x, y):  # Scale to +-1.0
         x0, y0 = self.origin
@@ -142,11 +148,15 @@ class PolarCurve(Curve): # Points are complex
         self.graph.addcurve(self) # May have been removed by clear()
         self.lastpoint = None
         if self.populate is not None:
-            pop = self.populate(self, *self.args)
-            if isinstance(pop, type_gen):
-                # populate was a generator function, pop is a generator.
-                for z in pop:
-                    self.point(z)
+            self.graph._start()  # Render connected lines as polylines
+            try:
+                pop = self.populate(self, *self.args)
+                if isinstance(pop, type_gen):
+                    # populate was a generator function, pop is a generator.
+                    for z in pop:
+                        self.point(z)
+            finally:
+                self.graph._flush()
 
 
 class TSequence(Curve):
@@ -168,11 +178,15 @@ class TSequence(Curve):
             self.count += 1
         x = 0
         dx = 1/size
-        for _ in range(self.count):
-            self.point(x, self.data[p])
-            x -= dx
-            p -= 1
-            p %= size
+        self.graph._start()
+        try:
+            for _ in range(self.count):
+                self.point(x, self.data[p])
+                x -= dx
+                p -= 1
+                p %= size
+        finally:
+            self.graph._flush()
         self.point()
 
 
@@ -185,10 +199,48 @@ class Graph():
         self.y1 = self.location[1] + self.height - border
         self.gridcolor = gridcolor
         self.curves = set()
+        # Between ._start and ._flush lines are accumulated into a polyline
+        self._batch = False
+        self._pts = array('h', (0 for _ in range(2 * _NPOINTS)))
+        self._npts = 0
+        self._pcolor = None
 
     def addcurve(self, curve):
         self.curves.add(curve)
 
+    def _start(self):
+        self._batch = True
+
+    def _flush(self):
+        self._draw_pts()
+        self._batch = False
+
+    # Draw a line in pixel coordinates or add it to the current polyline. A
+    # line which does not continue the polyline causes it to be drawn.
+    def _line(self, xs, ys, xe, ye, color):
+        if not self._batch:
+            self.tft.draw_line(xs, ys, xe, ye, color)
+            return
+        pts = self._pts
+        n = self._npts
+        if n and (n == _NPOINTS or color != self._pcolor
+                  or pts[2 * n - 2] != xs or pts[2 * n - 1] != ys):
+            self._draw_pts()
+            n = 0
+        if not n:
+            pts[0] = xs
+            pts[1] = ys
+            n = 1
+            self._pcolor = color
+        pts[2 * n] = xe
+        pts[2 * n + 1] = ye
+        self._npts = n + 1
+
+    def _draw_pts(self):
+        if self._npts > 1:
+            self.tft.draw_polyline(memoryview(self._pts)[: 2 * self._npts], self._pcolor)
+        self._npts = 0
+
     def clear(self):
         tft = Screen.tft
         self.curves = set()
@@ -244,7 +296,7 @@ class CartesianGraph(NoTouch, Graph):
         ys = round(self.yp_origin - start[1] * self.y_axis_len)
         xe = round(self.xp_origin + end[0] * self.x_axis_len)
         ye = round(self.yp_origin - end[1] * self.y_axis_len)
-        self.tft.draw_line(xs, ys, xe, ye, color)
+        self._line(xs, ys, xe, ye, color)
 
 class PolarGraph(NoTouch, Graph):
     def __init__(self, location, *, height=250, fgcolor=WHITE, bgcolor=None,
@@ -287,4 +339,4 @@ class PolarGraph(NoTouch, Graph):
         ys = round(self.yp_origin - start.imag * self.radius)
         xe = round(self.xp_origin + end.real * self.radius)
         ye = round(self.yp_origin - end.imag * self.radius)
-        self.tft.draw_line(xs, ys, xe, ye, color)
+        self._line(xs, ys, xe, ye, color)
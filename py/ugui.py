@@ -8,6 +8,7 @@
 import uasyncio as asyncio
 from uasyncio import Event
 import gc
+from micropython import const
 from micropython_ra8875.primitives.delay_ms import Delay_ms
 
 from micropython_ra8875.py.colors import *
@@ -16,6 +17,8 @@ from micropython_ra8875.driver.constants import *
 gc.collect()
 __version__ = (0, 1, 0)
 
+_GSHIFT = const(6)  # Touch index cells are 64 pixels square
+
 # Null function
 dolittle = lambda *_ : None
 
@@ -29,6 +32,17 @@ class Screen:
     tft = None
     objtouch = None
     is_shutdown = Event()
+    _async_open = False  # Redraw on screen change yields to the scheduler
+    _open_task = None
+    _double_buffer = False  # Render new screens in the hidden layer
+    _frame_ms = 0  # Redraw interval of dirty objects. 0: redraw immediately.
+    _render_task = None
+    _save_under = False  # Apertures save the area they cover in hidden layer
+    _saves = []  # Apertures whose covered area is held in hidden layer
+    _opening = False  # Defer redraws made by on_open until after _do_open
+    _render_cache = False  # Keep the previous screen's image in hidden layer
+    _cached = None  # Screen whose image is in the hidden layer
+    _on_show = None  # Screen whose image is displayed
 
     @classmethod
     def setup(cls, tft, objtouch=None):
@@ -44,6 +58,7 @@ class Screen:
     def set_grey_style(cls, *, desaturate=True, factor=2):
         cls.tft.dim(factor)
         cls.tft.desaturate(desaturate)
+        cls._cached = None  # Greyed objects in cached image are stale
         if Screen.current_screen is not None: # Can call before instantiated
             for obj in Screen.current_screen.displaylist:
                 if obj.visible and obj.greyed_out():
@@ -53,12 +68,155 @@ class Screen:
 
     @classmethod
     def show(cls):
+        cls.current_screen._clean()
         for obj in cls.current_screen.displaylist:
             if obj.visible: # In a buttonlist only show visible button
                 obj.redraw = True # Redraw static content
                 obj.draw_border()
                 obj.show()
 
+    # Clear the screen and redraw all objects, yielding to the scheduler while
+    # the display clears and after each object. Touch processing continues
+    # during the redraw. Only the clear is asynchronous: objects are drawn by
+    # their synchronous .show methods.
+    @classmethod
+    async def ashow(cls):
+        screen = cls.current_screen
+        screen._clean()
+        tft = cls._get_tft()
+        if cls._double_buffer:
+            cls._saves.clear()  # Hidden layer is about to be overwritten
+            cls._cached = None
+            tft.write_layer(tft.show_layer() ^ 1)
+        await tft.aclr_scr()
+        for obj in screen.displaylist:
+            if cls.current_screen is not screen:
+                break  # Screen has changed
+            if obj.visible:
+                obj.redraw = True # Redraw static content
+                obj.draw_border()
+                obj.show()
+                await asyncio.sleep_ms(0)
+        else:
+            if cls._double_buffer:
+                cls._flip(screen)
+
+    @classmethod
+    def async_open(cls, val=None):  # If True, screen changes use .ashow()
+        if val is not None:
+            cls._async_open = val
+        return cls._async_open
+
+    # If True, screen changes render into the hidden layer of a two layer
+    # display which is then shown. At 800x480 color depth is reduced to 8 bits.
+    @classmethod
+    def double_buffer(cls, val=None):
+        if val is not None:
+            cls._double_buffer = bool(val)
+            cls._saves.clear()
+            cls._cached = None
+            cls._on_show = None
+            cls.tft.dual_layer(cls._double_buffer or cls._save_under)
+            if cls.current_screen is not None:  # Display was cleared
+                cls.show()
+        return cls._double_buffer
+
+    # If True, the image of the previous screen is retained in the hidden layer
+    # so that returning to it with back() needs no redraw. Implies
+    # double_buffer. Display memory holds two layers, so only one screen can
+    # be cached: an LRU cache would degenerate to this.
+    @classmethod
+    def render_cache(cls, val=None):
+        if val is not None:
+            cls._render_cache = bool(val)
+            cls._cached = None
+            cls._on_show = None
+            if cls._render_cache:
+                cls.double_buffer(True)
+        return cls._render_cache
+
+    @classmethod
+    def _flip(cls, screen):  # Display the layer being written to
+        tft = cls.tft
+        tft.show_layer(tft.write_layer())
+        cls._cached = cls._on_show if cls._render_cache else None
+        cls._on_show = screen
+
+    # If True, opening an Aperture copies the area it covers to the hidden
+    # layer of a two layer display and closing it copies the area back. At
+    # 800x480 color depth is reduced to 8 bits.
+    @classmethod
+    def save_under(cls, val=None):
+        if val is not None:
+            cls._save_under = bool(val)
+            cls._saves.clear()
+            if not cls._double_buffer:
+                cls.tft.dual_layer(cls._save_under)
+                if cls.current_screen is not None:  # Display was cleared
+                    cls.show()
+        return cls._save_under
+
+    @classmethod
+    def _prune(cls):  # Discard saves of Apertures which can no longer close
+        chain = []
+        screen = cls.current_screen
+        while screen is not None:
+            chain.append(screen)
+            screen = screen.parent
+        cls._saves[:] = [z for z in cls._saves if z in chain]
+
+    @classmethod
+    def _save(cls, ap):  # Save area under Aperture ap in hidden layer
+        x0, y0, x1, y1 = ap._list_dims()
+        cls._saves[:] = [z for z in cls._saves if not z._overlaps(x0, y0, x1, y1)]
+        cls._cached = None
+        cls._saves.append(ap)
+        layer = cls.tft.show_layer()
+        cls.tft.bte_copy(x0, y0, x1, y1, x0, y0, layer, layer ^ 1)
+
+    @classmethod
+    def _restore(cls, ap):  # Restore area under ap. Return False if not saved.
+        if ap not in cls._saves:
+            return False
+        cls._saves.remove(ap)
+        x0, y0, x1, y1 = ap._list_dims()
+        layer = cls.tft.show_layer()
+        cls.tft.bte_copy(x0, y0, x1, y1, x0, y0, layer ^ 1, layer)
+        return True
+
+    # If fps > 0 objects whose value changes are marked dirty and a task
+    # redraws dirty objects on the current screen at up to that frame rate.
+    # 0 restores immediate redrawing. Returns the current rate.
+    @classmethod
+    def frame_rate(cls, fps=None):
+        if fps is not None:
+            cls._frame_ms = max(1, int(1000 // fps)) if fps > 0 else 0
+            if cls._frame_ms:
+                if cls._render_task is None:
+                    cls._render_task = asyncio.create_task(cls._render())
+            else:
+                cls.flush()
+        return 1000 // cls._frame_ms if cls._frame_ms else 0
+
+    # Redraw any dirty objects on the current screen now
+    @classmethod
+    def flush(cls):
+        cs = cls.current_screen
+        if cs is not None:
+            dl = cs.dirtylist
+            for obj in dl:  # Objects may be invalidated during the loop
+                obj._dirty = False
+                if obj.visible:
+                    obj._draw()
+            dl.clear()
+
+    @classmethod
+    async def _render(cls):
+        while cls._frame_ms:
+            await asyncio.sleep_ms(cls._frame_ms)
+            cls.flush()
+        cls._render_task = None
+
     @classmethod
     def change(cls, cls_new_screen, *, forward=True, args=[], kwargs={}):
         init = cls.current_screen is None
@@ -68,6 +226,11 @@ class Screen:
             for entry in cls.current_screen.tasklist:
                 if entry[1]:  # To be cancelled on screen change
                     entry[0].cancel()
+            if cls._open_task is not None:  # Redraw may be in progress
+                cls._open_task.cancel()
+                cls._open_task = None
+                if cls._double_buffer:  # Resume drawing to visible layer
+                    cls.tft.write_layer(cls.tft.show_layer())
         cs_old = cls.current_screen
         cs_old.on_hide() # Optional method in subclass
         if forward:
@@ -80,8 +243,16 @@ class Screen:
         else:
             cs_new = cls_new_screen # An object, not a class
         cls.current_screen = cs_new
-        cs_new.on_open() # Optional subclass method
+        # A saved or cached image may be displayed over redraws made by
+        # on_open: defer them to the flush in _do_open.
+        cls._opening = cls._save_under or cls._render_cache
+        try:
+            cs_new.on_open() # Optional subclass method
+        finally:
+            cls._opening = False
         cs_new._do_open(cs_old) # Clear and redraw
+        if cls._saves:
+            cls._prune()
         cs_new.after_open() # Optional subclass method
         if init:
             try:
@@ -95,6 +266,12 @@ class Screen:
         cls.is_shutdown.clear()
         for entry in cls.current_screen.tasklist:
             entry[0].cancel()
+        if cls._render_task is not None:
+            cls._render_task.cancel()
+            cls._render_task = None
+        cls._frame_ms = 0
+        cls._cached = None
+        cls._on_show = None
         await asyncio.sleep_ms(0)  # Allow subclass to cancel tasks
         cls.tft.clr_scr()
         cls.current_screen = None  # Ensure another demo can run
@@ -111,6 +288,7 @@ class Screen:
             raise OSError('You must create a Screen instance')
         if isinstance(obj, Touchable):
             cls.current_screen.touchlist.append(obj)
+            cls.current_screen._grid = None  # Rebuild touch index on next touch
         cls.current_screen.displaylist.append(obj)
 
     @classmethod
@@ -121,6 +299,8 @@ class Screen:
         self.touchlist = []
         self.displaylist = []
         self.tasklist = []  # Allow instance to register tasks for shutdown
+        self.dirtylist = []  # Objects awaiting redraw by render task
+        self._grid = None  # Touch index: touchable objects in each cell
         self.modal = False
         if Screen.current_screen is None: # Initialising class and task
             asyncio.create_task(Screen.objtouch.touchtest()) # One task only
@@ -131,21 +311,76 @@ class Screen:
     def _do_open(self, old_screen): # Aperture overrides
         show_all = True
         tft = Screen._get_tft()
-# If opening a Screen from an Aperture just blank and redraw covered area
+# If opening a Screen from an Aperture restore the covered area if it was
+# saved, otherwise blank and redraw it. Then redraw objects which changed.
         if old_screen.modal:
             show_all = False
-            x0, y0, x1, y1 = old_screen._list_dims()
-            tft.fill_rectangle(x0, y0, x1, y1, SYS_BGCOLOR) # Blank to screen BG
-            for obj in [z for z in self.displaylist if z.overlaps(x0, y0, x1, y1)]:
-                if obj.visible:
-                    obj.redraw = True # Redraw static content
-                    obj.draw_border()
-                    obj.show()
+            if not Screen._restore(old_screen):
+                x0, y0, x1, y1 = old_screen._list_dims()
+                tft.fill_rectangle(x0, y0, x1, y1, SYS_BGCOLOR) # Blank to screen BG
+                for obj in [z for z in self.displaylist if z.overlaps(x0, y0, x1, y1)]:
+                    if obj.visible:
+                        obj.redraw = True # Redraw static content
+                        obj.draw_border()
+                        obj.show()
+            Screen.flush()
+            Screen._on_show = self
+# If the screen's image is cached display it and redraw objects which changed
+        elif self is Screen._cached:
+            tft.write_layer(tft.show_layer() ^ 1)
+            Screen._flip(self)
+            Screen.flush()
 # Normally clear the screen and redraw everything
+        elif Screen._async_open:
+            Screen._open_task = asyncio.create_task(Screen.ashow())
+        elif Screen._double_buffer:  # Render in hidden layer then show it
+            Screen._saves.clear()
+            Screen._cached = None
+            tft.write_layer(tft.show_layer() ^ 1)
+            tft.clr_scr()
+            Screen.show()
+            Screen._flip(self)
         else:
             tft.clr_scr()
             Screen.show()
 
+    # Build a uniform grid holding the touchable objects whose bounding box
+    # overlaps each cell. Deferred until the first touch because object
+    # dimensions may be set after the constructor calls addobject.
+    def _index(self):
+        tft = Screen.tft
+        self._ncols = ncols = (tft.width() >> _GSHIFT) + 1
+        nrows = (tft.height() >> _GSHIFT) + 1
+        grid = [[] for _ in range(ncols * nrows)]
+        for obj in self.touchlist:  # Cells retain touchlist order
+            x, y = obj.location
+            x = int(x)  # Locations may be floats
+            y = int(y)
+            c0 = max(x >> _GSHIFT, 0)
+            c1 = min(int(x + obj.width) >> _GSHIFT, ncols - 1)
+            for r in range(max(y >> _GSHIFT, 0), min(int(y + obj.height) >> _GSHIFT, nrows - 1) + 1):
+                for c in range(c0, c1 + 1):
+                    grid[r * ncols + c].append(obj)
+        self._grid = grid
+
+    # Must be called if a touchable object on the screen is moved or resized
+    def reindex(self):
+        self._grid = None
+
+    # Touchable objects which may contain point x, y
+    def _candidates(self, x, y):
+        if self._grid is None:
+            self._index()
+        n = (y >> _GSHIFT) * self._ncols + (x >> _GSHIFT)
+        if x < 0 or y < 0 or n >= len(self._grid):
+            return ()
+        return self._grid[n]
+
+    def _clean(self):  # Screen is being redrawn in full
+        for obj in self.dirtylist:
+            obj._dirty = False
+        self.dirtylist.clear()
+
     def on_open(self): # Optionally implemented in subclass
         return
 
@@ -185,6 +420,9 @@ class Aperture(Screen):
 
     def _do_open(self, old_screen):
         tft = Screen._get_tft()
+        if Screen._save_under and old_screen is self.parent:  # Not on back()
+            Screen._save(self)
+        Screen._on_show = None  # Displayed image is not that of a Screen
         x, y = self.location[0], self.location[1]
         tft.fill_rectangle(x, y, x + self.width, y + self.height, self.bgcolor)
         if self.draw_border:
@@ -198,6 +436,10 @@ class Aperture(Screen):
         y1 = self.location[1] + self.height
         return x0, y0, x1, y1
 
+    def _overlaps(self, xa, ya, xb, yb):
+        x0, y0, x1, y1 = self._list_dims()
+        return ya <= y1 and yb >= y0 and xa <= x1 and xb >= x0
+
     @classmethod
     def value(cls, val=None): # Mechanism for testing the outcome of a dialog box
         if val is not None:
@@ -207,6 +449,10 @@ class Aperture(Screen):
 # Base class for all displayable objects
 class NoTouch:
     _greyed_out = False # Disabled by user code
+    _min_ms = 0  # Minimum interval between redraws on value change
+    _held = False  # Redraws are being held back
+    _update = False  # A held back redraw is pending
+    _new_border = False  # Border must be redrawn with the next .show
 
     def __init__(self, location, font, height, width, fgcolor, bgcolor, fontcolor, border, value, initial_value):
         Screen.addobject(self)
@@ -220,6 +466,7 @@ class NoTouch:
         self.width = width
         self.fill = bgcolor is not None
         self.visible = True # Used by ButtonList class for invisible buttons
+        self._dirty = False  # Awaiting redraw by render task
         tft = Screen._get_tft(False) # Not greyed out
         if font is None:
             self.font = DEFAULT_FONT
@@ -272,12 +519,47 @@ class NoTouch:
         if show:
             self.show_if_current()
 
+    # If a frame rate is set the object is marked dirty for redraw by the
+    # render task. If the screen's image may be restored without a redraw
+    # (save-under or render cache) objects on other screens are marked so that
+    # they can be redrawn then: the list is discarded when the screen is
+    # redrawn in full. Otherwise objects on other screens are ignored.
     def show_if_current(self):
-        if self.screen is Screen.current_screen:
-            self.show()
+        if self._min_ms and self.screen is Screen.current_screen:  # Rate limited
+            if self._held:  # Latest value is drawn when interval ends
+                self._update = True
+                return
+            self._held = True
+            asyncio.create_task(self._hold())
+        current = self.screen is Screen.current_screen
+        if Screen._frame_ms or Screen._opening or (not current and (Screen._save_under or Screen._render_cache)):
+            if not self._dirty:
+                self._dirty = True
+                self.screen.dirtylist.append(self)
+        elif current:
+            self._draw()
+
+    def _draw(self):  # Border and body are drawn together
+        if self._new_border:
+            self.draw_border()
+        self.show()
+
+    async def _hold(self):
+        await asyncio.sleep_ms(self._min_ms)
+        self._held = False
+        if self._update:
+            self._update = False
+            self.show_if_current()
+
+    # Limit redraws caused by value changes to hz per second. 0: no limit.
+    def max_rate(self, hz=None):
+        if hz is not None:
+            self._min_ms = max(1, 1000 // hz) if hz > 0 else 0
+        return 1000 // self._min_ms if self._min_ms else 0
 
 # Called by Screen.show(). Draw background and bounding box if required
     def draw_border(self):
+        self._new_border = False
         if self.screen is Screen.current_screen:
             tft = self.tft
             x = self.location[0]
@@ -320,7 +602,7 @@ class Touchable(NoTouch):
             tft = self.tft
             tft.usegrey(val)
             self._greyed_out = val
-            self.draw_border()
+            self._new_border = True  # Drawn with the body, possibly deferred
             self.redraw = True
             self.show_if_current()
         return self._greyed_out
@@ -78,9 +78,9 @@ class Dropdown(Touchable):
         halflength = (self.height - 8) // 2
         length = halflength * 2
         if length > 0:
-            tft.draw_hline(xcentre - halflength, ycentre - halflength, length, self.fgcolor)
-            tft.draw_line(xcentre - halflength, ycentre - halflength, xcentre, ycentre + halflength, self.fgcolor)
-            tft.draw_line(xcentre + halflength, ycentre - halflength, xcentre, ycentre + halflength, self.fgcolor)
+            tft.draw_triangle(xcentre - halflength, ycentre - halflength,
+                              xcentre + halflength, ycentre - halflength,
+                              xcentre, ycentre + halflength, self.fgcolor)
 
     def _touched(self, x, y):
         if len(self.elements) > 1:
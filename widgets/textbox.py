@@ -3,7 +3,7 @@
 # Released under the MIT License (MIT). See LICENSE.
 # Copyright (c) 2019 Peter Hinch
 
-from micropython_ra8875.py.ugui import Touchable
+from micropython_ra8875.py.ugui import Touchable, Screen
 
 class Textbox(Touchable):
     def __init__(self, location, width, nlines, font, *, border=2, fgcolor=None,
@@ -100,10 +100,39 @@ class Textbox(Touchable):
         s = self.start
         self.start = max(0, min(self.start + n, value - self.nlines))
         if s != self.start:
-            self.show_if_current()
+            self._scroll_show(self.start - s)
             return True
         return False
 
+    # Scroll by dn lines: move the lines which remain visible with the block
+    # transfer engine and render only the new ones.
+    def _scroll_show(self, dn):
+        if not self.visible:
+            return
+        nlines = self.nlines
+        if self.screen is not Screen.current_screen or abs(dn) >= nlines or self._dirty:
+            self.show_if_current()
+            return
+        tft = self.tft
+        bw = self.border
+        fh = self.text_style[2].height()
+        x0 = self.location[0] + bw
+        x1 = self.location[0] + self.width - bw
+        y0 = self.location[1] + bw
+        if dn > 0:  # Move text up, draw new lines at bottom
+            tft.bte_copy(x0, y0 + dn * fh, x1, y0 + nlines * fh - 1, x0, y0)
+            first = nlines - dn  # Line number in window of first new line
+        else:
+            tft.bte_copy(x0, y0, x1, y0 + (nlines + dn) * fh - 1, x0, y0 - dn * fh)
+            first = 0
+        ys = y0 + first * fh
+        n = abs(dn)
+        tft.fill_rectangle(x0, ys, x1, ys + n * fh - 1, self.bgcolor)
+        start = self.start + first
+        for line in self.lines[start : start + n]:
+            tft.print_left(x0, ys, line, self.text_style, self.tab)
+            ys += fh
+
     def _touched(self, x, y): # Was touched
         self.scroll(-1 if  2 * (y - self.location[1]) < self.height else 1)
 